@@ -0,0 +1,144 @@
+-- =====================================================
+-- 大学课程注册与成绩管理数据库系统 - 性能优化脚本
+-- 数据库: MySQL 8.0+
+-- 说明: 针对应用层 (src/dao.py) 的热点查询补充索引等结构,
+--       在主结构脚本执行完成后单独运行, 不由 setup.py 自动执行
+-- 用法: mysql -u root -p <应用数据库名, 即 DB_NAME> < database_performance.sql
+--       脚本不含 USE 语句, 作用于命令行指定的数据库
+-- =====================================================
+
+-- =====================================================
+-- 1. 班次选课人数统计表 (由触发器维护)
+-- =====================================================
+
+-- 每个班次当前在读 ('Enrolled') 人数, 列表查询按主键直接读取, 不再逐次 COUNT
+CREATE TABLE IF NOT EXISTS SectionStats (
+    SectionID INT PRIMARY KEY,
+    CurrentEnrollment INT NOT NULL DEFAULT 0
+) ENGINE=InnoDB COMMENT='班次选课人数统计表';
+
+-- 根据现有选课记录初始化统计数据
+INSERT INTO SectionStats (SectionID, CurrentEnrollment)
+SELECT sec.SectionID, COUNT(e.EnrollmentID)
+FROM Section sec
+LEFT JOIN Enrollment e ON e.SectionID = sec.SectionID AND e.Status = 'Enrolled'
+GROUP BY sec.SectionID
+ON DUPLICATE KEY UPDATE CurrentEnrollment = VALUES(CurrentEnrollment);
+
+DROP TRIGGER IF EXISTS trg_enrollment_ai;
+DROP TRIGGER IF EXISTS trg_enrollment_au;
+DROP TRIGGER IF EXISTS trg_enrollment_ad;
+
+-- 新增选课记录
+DELIMITER //
+CREATE TRIGGER trg_enrollment_ai
+AFTER INSERT ON Enrollment
+FOR EACH ROW
+BEGIN
+    IF NEW.Status = 'Enrolled' THEN
+        INSERT INTO SectionStats (SectionID, CurrentEnrollment)
+        VALUES (NEW.SectionID, 1)
+        ON DUPLICATE KEY UPDATE CurrentEnrollment = CurrentEnrollment + 1;
+    END IF;
+END//
+DELIMITER ;
+
+-- 选课状态变化 (退课、结课、转班)
+DELIMITER //
+CREATE TRIGGER trg_enrollment_au
+AFTER UPDATE ON Enrollment
+FOR EACH ROW
+BEGIN
+    IF OLD.Status = 'Enrolled'
+       AND (NEW.Status <> 'Enrolled' OR NEW.SectionID <> OLD.SectionID) THEN
+        UPDATE SectionStats
+        SET CurrentEnrollment = GREATEST(CurrentEnrollment - 1, 0)
+        WHERE SectionID = OLD.SectionID;
+    END IF;
+    IF NEW.Status = 'Enrolled'
+       AND (OLD.Status <> 'Enrolled' OR NEW.SectionID <> OLD.SectionID) THEN
+        INSERT INTO SectionStats (SectionID, CurrentEnrollment)
+        VALUES (NEW.SectionID, 1)
+        ON DUPLICATE KEY UPDATE CurrentEnrollment = CurrentEnrollment + 1;
+    END IF;
+END//
+DELIMITER ;
+
+-- 删除选课记录
+DELIMITER //
+CREATE TRIGGER trg_enrollment_ad
+AFTER DELETE ON Enrollment
+FOR EACH ROW
+BEGIN
+    IF OLD.Status = 'Enrolled' THEN
+        UPDATE SectionStats
+        SET CurrentEnrollment = GREATEST(CurrentEnrollment - 1, 0)
+        WHERE SectionID = OLD.SectionID;
+    END IF;
+END//
+DELIMITER ;
+
+-- =====================================================
+-- 2. 课程全文检索索引
+-- =====================================================
+
+-- search_courses 使用 MATCH ... AGAINST 代替 LIKE '%关键字%' 全表扫描
+-- 采用 ngram 分词器以支持中文课程名称 (ngram_token_size 默认为 2)
+ALTER TABLE Course ADD FULLTEXT INDEX ft_course (CourseName, Description) WITH PARSER ngram;
+
+-- =====================================================
+-- 3. 成绩绩点生成列与状态触发器
+-- =====================================================
+
+-- 绩点由期末成绩自动计算 (与 src/config.py 中的绩点表保持一致), 更新成绩时只需写入 FinalGrade
+ALTER TABLE Enrollment MODIFY COLUMN GradePoints DECIMAL(3,2)
+    GENERATED ALWAYS AS (
+        CASE
+            WHEN FinalGrade IS NULL THEN NULL
+            WHEN FinalGrade < 0 OR FinalGrade > 100 THEN 0.0
+            WHEN FinalGrade >= 97 THEN 4.0
+            WHEN FinalGrade >= 93 THEN 3.7
+            WHEN FinalGrade >= 90 THEN 3.3
+            WHEN FinalGrade >= 87 THEN 3.0
+            WHEN FinalGrade >= 83 THEN 2.7
+            WHEN FinalGrade >= 80 THEN 2.3
+            WHEN FinalGrade >= 77 THEN 2.0
+            WHEN FinalGrade >= 73 THEN 1.7
+            WHEN FinalGrade >= 70 THEN 1.3
+            WHEN FinalGrade >= 67 THEN 1.0
+            WHEN FinalGrade >= 65 THEN 0.7
+            ELSE 0.0
+        END
+    ) STORED;
+
+DROP TRIGGER IF EXISTS trg_enrollment_grade_bu;
+
+-- 录入成绩后根据及格线 (60 分, 对应 RULES.passing) 设置选课状态
+DELIMITER //
+CREATE TRIGGER trg_enrollment_grade_bu
+BEFORE UPDATE ON Enrollment
+FOR EACH ROW
+BEGIN
+    IF NEW.FinalGrade IS NOT NULL
+       AND (OLD.FinalGrade IS NULL OR NEW.FinalGrade <> OLD.FinalGrade) THEN
+        SET NEW.Status = IF(NEW.FinalGrade >= 60, 'Completed', 'Failed');
+    END IF;
+END//
+DELIMITER ;
+
+-- =====================================================
+-- 4. 登录覆盖索引
+-- =====================================================
+
+-- authenticate_user 按 Username + Status 查找, 校验密码所需的列全部包含在索引中
+-- Password 使用整列而非前缀 (bcrypt 哈希固定 60 字符), 前缀索引无法作为覆盖索引
+-- 不包含 LastLoginDate: 每次登录都会更新该列, 放入索引会让登录同时维护这个宽索引;
+-- 查询仍返回 LastLoginDate, 只需按主键回表读取一行
+CREATE INDEX idx_user_auth ON User (Username, Status, UserID, Password, UserType);
+
+-- =====================================================
+-- 5. 课程统计索引
+-- =====================================================
+
+-- get_course_statistics 按班次分组统计状态与成绩, 所需列均在索引中
+CREATE INDEX idx_enr_sec_status_grade ON Enrollment (SectionID, Status, FinalGrade);
@@ -4,34 +4,61 @@ University Course Registration and Grade Management System
 """
 
 import os
+from types import MappingProxyType
+from typing import NamedTuple
 from dotenv import load_dotenv
 
 # Load environment variables
 load_dotenv()
 
+# One snapshot of the environment; the settings below read from it with plain dict gets
+_ENV = dict(os.environ)
+
 class DatabaseConfig:
     """Database configuration settings"""
     
+    # Constants only: instances carry no per-object __dict__
+    __slots__ = ()
+    
     # MySQL Database Configuration
-    DB_HOST = os.getenv('DB_HOST', 'localhost')
-    DB_PORT = int(os.getenv('DB_PORT', 3306))
-    DB_USER = os.getenv('DB_USER', 'course_app')
-    DB_PASSWORD = os.getenv('DB_PASSWORD', 'CourseApp2024!')
-    DB_NAME = os.getenv('DB_NAME', 'CourseRegistrationDB')
+    DB_HOST = _ENV.get('DB_HOST', 'localhost')
+    DB_PORT = int(_ENV.get('DB_PORT', '3306'))
+    DB_USER = _ENV.get('DB_USER', 'course_app')
+    DB_PASSWORD = _ENV.get('DB_PASSWORD', 'CourseApp2024!')
+    DB_NAME = _ENV.get('DB_NAME', 'CourseRegistrationDB')
     
     # Connection Pool Settings
     POOL_NAME = 'course_pool'
-    POOL_SIZE = 10
-    POOL_RESET_SESSION = True
+    # The pool opens every connection when it is built, so the single-user CLI keeps it small;
+    # DB_POOL_SIZE raises it (mysql-connector caps pools at 32)
+    POOL_SIZE = min(32, max(1, int(_ENV.get('DB_POOL_SIZE', 5))))
+    # Connections checked and warmed at startup
+    POOL_MIN = min(POOL_SIZE, int(_ENV.get('DB_POOL_MIN', 2)))
+    # Server-side prepared statements kept open per pooled connection
+    STATEMENT_CACHE_SIZE = int(_ENV.get('DB_STATEMENT_CACHE_SIZE', 256))
+    # No COM_RESET_CONNECTION on release; DatabaseManager rolls back open transactions instead
+    POOL_RESET_SESSION = False
     
     # Application Settings
     SESSION_TIMEOUT = 3600  # 1 hour
     MAX_LOGIN_ATTEMPTS = 3
     PASSWORD_MIN_LENGTH = 8
+    BCRYPT_ROUNDS = 10  # cost factor for newly hashed passwords
+    AUTH_CACHE_TTL = 30  # seconds a successful password check is remembered
+    
+    # Built on first use; settings do not change after the environment is loaded
+    _connection_config = None
     
     @classmethod
     def get_connection_config(cls):
-        """Get database connection configuration"""
+        """Get database connection configuration (read-only, cached)"""
+        if cls._connection_config is None:
+            cls._connection_config = MappingProxyType(cls._build_connection_config())
+        return cls._connection_config
+    
+    @classmethod
+    def _build_connection_config(cls):
+        """Assemble the connection settings from the class attributes"""
         return {
             'host': cls.DB_HOST,
             'port': cls.DB_PORT,
@@ -39,48 +66,97 @@ class DatabaseConfig:
             'password': cls.DB_PASSWORD,
             'database': cls.DB_NAME,
             'charset': 'utf8mb4',
-            'autocommit': False,
+            # Reads open no transaction, so releasing a connection needs no ROLLBACK;
+            # multi-statement writes wrap themselves in START TRANSACTION ... COMMIT
+            'autocommit': True,
             'pool_name': cls.POOL_NAME,
             'pool_size': cls.POOL_SIZE,
-            'pool_reset_session': cls.POOL_RESET_SESSION
+            'pool_reset_session': cls.POOL_RESET_SESSION,
+            # Driver tuning: prefer the C extension, drain unread results automatically
+            # and keep warnings non-fatal. Hot DAO queries can additionally request
+            # server-side prepared statements with connection.cursor(prepared=True).
+            'use_pure': False,
+            'consume_results': True,
+            'raise_on_warnings': False
         }
 
+# Grade Point Scale: (min, max, points) per grade band, highest band first
+_GRADE_SCALE = (
+    (97, 100, 4.0),
+    (93, 96, 3.7),
+    (90, 92, 3.3),
+    (87, 89, 3.0),
+    (83, 86, 2.7),
+    (80, 82, 2.3),
+    (77, 79, 2.0),
+    (73, 76, 1.7),
+    (70, 72, 1.3),
+    (67, 69, 1.0),
+    (65, 66, 0.7),
+    (0, 64, 0.0),
+)
+
+# Grade points for every whole grade 0..100, indexed by grade
+_GRADE_LUT = tuple(
+    points
+    for min_grade, max_grade, points in reversed(_GRADE_SCALE)
+    for _ in range(min_grade, max_grade + 1)
+)
+
+# The lookup table is bound as a default argument so each call reads it as a local
+def _calculate_grade_points(grade, _lut=_GRADE_LUT):
+    """Calculate grade points from numerical grade"""
+    if grade is None:
+        return None
+    
+    if grade < 0 or grade > 100:
+        return 0.0
+    
+    # Bands start on whole grades, so the floored grade indexes the table directly
+    return _lut[int(grade)]
+
+def _calculate_grade_points_batch(grades, _lut=_GRADE_LUT):
+    """Calculate grade points for a sequence of grades in one pass (bulk grade-book scoring)"""
+    return [
+        _lut[int(grade)] if grade is not None and 0 <= grade <= 100
+        else None if grade is None
+        else 0.0
+        for grade in grades
+    ]
+
+class _Rules(NamedTuple):
+    """Business rules and paging limits"""
+    passing: float = 60.0
+    max_gpa: float = 4.0
+    min_credits: int = 10
+    max_credits: int = 40
+    items_per_page: int = 10
+
+# Immutable rule set read by the validation paths
+RULES = _Rules()
+
 class AppConfig:
     """Application configuration settings"""
     
+    # Constants only: instances carry no per-object __dict__
+    __slots__ = ()
+    
     # UI Settings
-    ITEMS_PER_PAGE = 10
+    ITEMS_PER_PAGE = RULES.items_per_page
     MAX_DISPLAY_WIDTH = 120
     
-    # Business Rules
-    MIN_CREDITS_PER_SEMESTER = 10
-    MAX_CREDITS_PER_SEMESTER = 40
-    PASSING_GRADE = 60.0
-    MAX_GPA = 4.0
+    # Caching
+    SECTION_CACHE_TTL = 30  # seconds a term's section listing is reused
+    READ_CACHE_TTL = 5  # seconds department lists, GPAs and course statistics are reused
+    COURSE_CACHE_TTL = 60  # seconds course listings and search results are reused
+    PROFILE_CACHE_TTL = 30  # seconds the student/instructor profile loaded at login is reused
     
-    # Grade Point Scale
-    GRADE_SCALE = {
-        (97, 100): 4.0,
-        (93, 96): 3.7,
-        (90, 92): 3.3,
-        (87, 89): 3.0,
-        (83, 86): 2.7,
-        (80, 82): 2.3,
-        (77, 79): 2.0,
-        (73, 76): 1.7,
-        (70, 72): 1.3,
-        (67, 69): 1.0,
-        (65, 66): 0.7,
-        (0, 64): 0.0
-    }
+    # Business Rules (aliases of RULES)
+    MIN_CREDITS_PER_SEMESTER = RULES.min_credits
+    MAX_CREDITS_PER_SEMESTER = RULES.max_credits
+    PASSING_GRADE = RULES.passing
+    MAX_GPA = RULES.max_gpa
     
-    @classmethod
-    def calculate_grade_points(cls, grade):
-        """Calculate grade points from numerical grade"""
-        if grade is None:
-            return None
-        
-        for (min_grade, max_grade), points in cls.GRADE_SCALE.items():
-            if min_grade <= grade <= max_grade:
-                return points
-        return 0.0
\ No newline at end of file
+    # Grade points (module-level functions, see above)
+    calculate_grade_points = staticmethod(_calculate_grade_points)
+    calculate_grade_points_batch = staticmethod(_calculate_grade_points_batch)
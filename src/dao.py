@@ -3,73 +3,298 @@ Data Access Object (DAO) Module
 University Course Registration and Grade Management System
 """
 
-from typing import List, Optional, Dict, Any, Tuple
+from typing import List, Optional, Dict, Any, Tuple, Iterator
 from datetime import datetime, date
+from contextlib import contextmanager
+from contextvars import ContextVar
+import copy
+import functools
 import logging
 from database import db_manager
 from models import *
-from config import AppConfig
+from config import AppConfig, DatabaseConfig
+from cache import TTLCache
 import bcrypt
+import hashlib
+import hmac
+import os
+import threading
 
 logger = logging.getLogger(__name__)
 
+# Successful password checks, keyed by (username, stored hash, keyed password digest).
+# The digest uses a per-process random key so plaintext-equivalent values are never held.
+_AUTH_CACHE = TTLCache(ttl=DatabaseConfig.AUTH_CACHE_TTL, maxsize=1024)
+_AUTH_CACHE_KEY = os.urandom(32)
+
+@functools.lru_cache(maxsize=None)
+def _dummy_password_hash() -> bytes:
+    """Hash checked against when the username does not exist, so both paths cost one bcrypt run
+    
+    Built on the first login attempt rather than at import, keeping a full bcrypt
+    run off the CLI's startup path.
+    """
+    return bcrypt.hashpw(b'dummy-password', bcrypt.gensalt(DatabaseConfig.BCRYPT_ROUNDS))
+
+def _verify_password(username: str, password: str, stored_hash: str) -> bool:
+    """Check a password against its bcrypt hash, reusing recent successful checks"""
+    password_bytes = password.encode('utf-8')
+    digest = hmac.new(_AUTH_CACHE_KEY, password_bytes, hashlib.sha256).digest()
+    cache_key = (username, stored_hash, digest)
+    if _AUTH_CACHE.get(cache_key):
+        return True
+    
+    if bcrypt.checkpw(password_bytes, stored_hash.encode('utf-8')):
+        _AUTH_CACHE.set(cache_key, True)
+        return True
+    return False
+
+# Enum members by stored value: a dict hit per row instead of an Enum constructor call
+_GENDER_BY_VALUE = {member.value: member for member in Gender}
+_COURSE_TYPE_BY_VALUE = {member.value: member for member in CourseType}
+_USER_TYPE_BY_VALUE = {member.value: member for member in UserType}
+_USER_STATUS_BY_VALUE = {member.value: member for member in UserStatus}
+_ENROLLMENT_STATUS_BY_VALUE = {member.value: member for member in EnrollmentStatus}
+
+# Column lists in model field order, so tuple rows map positionally onto the dataclasses.
+# DECIMAL columns are CAST to DOUBLE so the driver decodes them straight to float
+# instead of building a Decimal that Python then converts for every row.
+_STUDENT_COLUMNS = """s.StudentID, s.UserID, s.Name, s.Gender, s.BirthDate, s.Email, s.Phone,
+                   s.College, s.Major, s.EnrollmentYear, s.CreatedDate, s.UpdatedDate"""
+_INSTRUCTOR_COLUMNS = """i.InstructorID, i.UserID, i.Name, i.Department, i.Email, i.Phone,
+                      i.Title, i.CreatedDate, i.UpdatedDate"""
+_COURSE_COLUMNS = """c.CourseID, c.CourseName, CAST(c.Credits AS DOUBLE) AS Credits, c.Department,
+                  c.CourseType, c.Description, c.CreatedDate, c.UpdatedDate"""
+
+# ngram_token_size of the ft_course FULLTEXT index (MySQL default)
+FULLTEXT_MIN_TERM_LENGTH = 2
+
+def _row_to_student(row) -> Student:
+    """Build a Student from a row selected with _STUDENT_COLUMNS; an empty Gender maps to None"""
+    return Student(*row[:3], _GENDER_BY_VALUE.get(row[3]), *row[4:])
+
+def _row_to_course(row) -> Course:
+    """Build a Course from a row selected with _COURSE_COLUMNS"""
+    return Course(*row[:4], _COURSE_TYPE_BY_VALUE[row[4]], *row[5:])
+
+def _row_to_instructor(row) -> Instructor:
+    """Build an Instructor from a row selected with _INSTRUCTOR_COLUMNS"""
+    return Instructor(*row)
+
+# Enrollment rows joined to student, course, section and instructor, in EnrollmentInfo field order
+_ENROLLMENT_INFO_QUERY = """
+    SELECT 
+        e.EnrollmentID,
+        e.StudentID,
+        s.Name as StudentName,
+        c.CourseID,
+        c.CourseName,
+        CAST(c.Credits AS DOUBLE) AS Credits,
+        sec.SectionID,
+        sec.Semester,
+        sec.Year,
+        sec.TimeSlot,
+        sec.Location,
+        i.Name as InstructorName,
+        e.Status,
+        CAST(e.FinalGrade AS DOUBLE) AS FinalGrade,
+        CAST(e.GradePoints AS DOUBLE) AS GradePoints,
+        e.EnrollmentDate
+    FROM Enrollment e
+    JOIN Student s ON e.StudentID = s.StudentID
+    JOIN Section sec ON e.SectionID = sec.SectionID
+    JOIN Course c ON sec.CourseID = c.CourseID
+    LEFT JOIN Instructor i ON sec.InstructorID = i.InstructorID
+"""
+
+def _row_to_enrollment_info(row) -> EnrollmentInfo:
+    """Build an EnrollmentInfo from a row selected with _ENROLLMENT_INFO_QUERY"""
+    return EnrollmentInfo(*row[:12], _ENROLLMENT_STATUS_BY_VALUE[row[12]], *row[13:])
+
+# Identity map for the current unit of work (one UI action); None outside identity_scope()
+_identity_map: ContextVar[Optional[Dict[tuple, Any]]] = ContextVar('identity_map', default=None)
+
+@contextmanager
+def identity_scope():
+    """Memoize get-by-id lookups for the duration of the block"""
+    token = _identity_map.set({})
+    try:
+        yield
+    finally:
+        _identity_map.reset(token)
+
+def cached_by_id(kind: str):
+    """Serve repeated get-by-id calls inside an identity_scope() from the identity map"""
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, key):
+            identity_map = _identity_map.get()
+            if identity_map is None:
+                return method(self, key)
+            
+            cache_key = (kind, key)
+            obj = identity_map.get(cache_key)
+            if obj is None:
+                obj = method(self, key)
+                if obj is not None:
+                    identity_map[cache_key] = obj
+            return obj
+        return wrapper
+    return decorator
+
+def _row_to_section_info(result) -> SectionInfo:
+    """Build a SectionInfo from a sp_GetAvailableSections row"""
+    return SectionInfo(
+        section_id=result['SectionID'],
+        course_id=result['CourseID'],
+        course_name=result['CourseName'],
+        # The procedure returns DECIMAL credits
+        credits=float(result['Credits']),
+        course_type=result['CourseType'],
+        semester=result['Semester'],
+        year=result['Year'],
+        max_capacity=result['MaxCapacity'],
+        current_enrollment=result['CurrentEnrollment'],
+        available_spots=result['AvailableSpots'],
+        time_slot=result['TimeSlot'],
+        location=result['Location'],
+        instructor_name=result['InstructorName'],
+        availability_status=result['AvailabilityStatus']
+    )
+
+# Term section listings keyed by (semester, year); cleared whenever enrollments or sections change
+_SECTION_LISTING_CACHE = TTLCache(ttl=AppConfig.SECTION_CACHE_TTL, maxsize=64)
+# Per-student availability keyed by (semester, year, student_id), reused while the student browses
+_STUDENT_AVAILABILITY_CACHE = TTLCache(ttl=AppConfig.SECTION_CACHE_TTL, maxsize=128)
+
+def _invalidate_section_listings():
+    """Drop cached section listings after a change to enrollment counts or sections"""
+    _SECTION_LISTING_CACHE.clear()
+    _STUDENT_AVAILABILITY_CACHE.clear()
+
+# Short-lived caches for read-only DAO methods, one per invalidation group and shared by
+# every DAO instance (each service builds its own DAOs)
+_READ_CACHES: Dict[str, TTLCache] = {}
+
+def cached_read(group: str, ttl: float = AppConfig.READ_CACHE_TTL):
+    """Serve repeated calls with equal arguments from the group's cache for ttl seconds
+    
+    The first method registered for a group sets that group's ttl. Callers get a shallow
+    copy, so changing a returned list, dict or model does not alter the cached result.
+    """
+    cache = _READ_CACHES.setdefault(group, TTLCache(ttl=ttl, maxsize=256))
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            key = (method.__name__, args + tuple(sorted(kwargs.items())))
+            return copy.copy(cache.get_or_load(key, lambda: method(self, *args, **kwargs)))
+        return wrapper
+    return decorator
+
+def _invalidate_reads(group: str):
+    """Drop a group's cached reads after a write that changes them"""
+    _READ_CACHES[group].clear()
+
 class BaseDAO:
     """Base Data Access Object with common operations"""
     
     def __init__(self):
         self.db = db_manager
     
+    def _forget_identity(self, kind: str, key):
+        """Drop an object from the current identity map after it has been modified"""
+        identity_map = _identity_map.get()
+        if identity_map is not None:
+            identity_map.pop((kind, key), None)
+    
     def _handle_db_error(self, operation: str, error: Exception):
         """Handle database errors consistently"""
-        logger.error(f"Database error in {operation}: {error}")
+        logger.error("Database error in %s: %s", operation, error)
         raise Exception(f"Database operation failed: {operation}")
 
+# One shared instance per DAO class; DAOs are stateless wrappers over db_manager
+_DAOS: Dict[type, BaseDAO] = {}
+_DAOS_LOCK = threading.Lock()
+
+def get_dao(dao_class):
+    """Return the shared instance of a DAO class, creating it on first use"""
+    dao = _DAOS.get(dao_class)
+    if dao is None:
+        with _DAOS_LOCK:
+            dao = _DAOS.get(dao_class)
+            if dao is None:
+                dao = _DAOS[dao_class] = dao_class()
+    return dao
+
 class UserDAO(BaseDAO):
     """User data access operations"""
     
+    INSERT_QUERY = """
+        INSERT INTO User (Username, Password, UserType, Status)
+        VALUES (%s, %s, %s, %s)
+    """
+    
+    @staticmethod
+    def insert_params(user: User) -> tuple:
+        """Hash the password and build the parameters for INSERT_QUERY"""
+        hashed_password = bcrypt.hashpw(user.password.encode('utf-8'),
+                                        bcrypt.gensalt(DatabaseConfig.BCRYPT_ROUNDS))
+        return (user.username, hashed_password.decode('utf-8'),
+                user.user_type.value, user.status.value)
+    
     def create_user(self, user: User) -> int:
         """Create a new user"""
         try:
-            # Hash password
-            hashed_password = bcrypt.hashpw(user.password.encode('utf-8'), bcrypt.gensalt())
-            
-            query = """
-                INSERT INTO User (Username, Password, UserType, Status)
-                VALUES (%s, %s, %s, %s)
-            """
-            params = (user.username, hashed_password.decode('utf-8'), 
-                     user.user_type.value, user.status.value)
-            
-            self.db.execute_update(query, params)
-            
-            # Get the created user ID
-            user_id_query = "SELECT LAST_INSERT_ID()"
-            result = self.db.execute_query(user_id_query, fetch_one=True)
-            return result['LAST_INSERT_ID()']
+            # The driver reports the generated UserID with the INSERT's OK packet
+            return self.db.execute_insert(self.INSERT_QUERY, self.insert_params(user))
             
         except Exception as e:
             self._handle_db_error("create_user", e)
     
+    def create_with_profile(self, user: User, profile_query: str, profile_params: tuple):
+        """Create a user and its Student/Instructor row in one transaction and one round trip
+        
+        profile_query takes the new UserID from LAST_INSERT_ID(); profile_params are its
+        remaining values.
+        """
+        # Hash before borrowing a connection so the transaction only spans the INSERTs
+        user_params = self.insert_params(user)
+        # If either INSERT fails the server skips the COMMIT and the connection's release
+        # rolls the open transaction back
+        script = f"START TRANSACTION; {self.INSERT_QUERY}; {profile_query}; COMMIT"
+        self.db.execute_multi(script, user_params + tuple(profile_params), commit=False)
+        # A new student or instructor changes the system row counts
+        _invalidate_reads('statistics')
+    
     def authenticate_user(self, username: str, password: str) -> Optional[User]:
         """Authenticate user login"""
         try:
+            # Built before the lookup so a first attempt costs the same whether or not the user exists
+            dummy_hash = _dummy_password_hash()
             query = """
                 SELECT UserID, Username, Password, UserType, Status, LastLoginDate
                 FROM User 
                 WHERE Username = %s AND Status = 'Active'
             """
-            result = self.db.execute_query(query, (username,), fetch_one=True)
+            result = self.db.execute_query(query, (username,), fetch_one=True, dictionary=False,
+                                           prepared=True)
+            
+            if not result:
+                # Spend the same bcrypt time as a real check so unknown usernames are not revealed
+                bcrypt.checkpw(password.encode('utf-8'), dummy_hash)
+                return None
             
-            if result and bcrypt.checkpw(password.encode('utf-8'), result['Password'].encode('utf-8')):
+            user_id, user_name, password_hash, user_type, status, last_login_date = result
+            if _verify_password(username, password, password_hash):
                 # Update last login date
-                self.update_last_login(result['UserID'])
+                self.update_last_login(user_id)
                 
                 return User(
-                    user_id=result['UserID'],
-                    username=result['Username'],
-                    user_type=UserType(result['UserType']),
-                    status=UserStatus(result['Status']),
-                    last_login_date=result['LastLoginDate']
+                    user_id=user_id,
+                    username=user_name,
+                    user_type=_USER_TYPE_BY_VALUE[user_type],
+                    status=_USER_STATUS_BY_VALUE[status],
+                    last_login_date=last_login_date
                 )
             return None
             
@@ -80,9 +305,9 @@ class UserDAO(BaseDAO):
         """Update user's last login timestamp"""
         try:
             query = "UPDATE User SET LastLoginDate = NOW() WHERE UserID = %s"
-            self.db.execute_update(query, (user_id,))
+            self.db.execute_update(query, (user_id,), prepared=True)
         except Exception as e:
-            logger.warning(f"Failed to update last login for user {user_id}: {e}")
+            logger.warning("Failed to update last login for user %s: %s", user_id, e)
     
     def get_user_by_id(self, user_id: int) -> Optional[User]:
         """Get user by ID"""
@@ -91,16 +316,18 @@ class UserDAO(BaseDAO):
                 SELECT UserID, Username, UserType, CreatedDate, Status, LastLoginDate
                 FROM User WHERE UserID = %s
             """
-            result = self.db.execute_query(query, (user_id,), fetch_one=True)
+            result = self.db.execute_query(query, (user_id,), fetch_one=True, dictionary=False,
+                                           prepared=True)
             
             if result:
+                user_id, username, user_type, created_date, status, last_login_date = result
                 return User(
-                    user_id=result['UserID'],
-                    username=result['Username'],
-                    user_type=UserType(result['UserType']),
-                    created_date=result['CreatedDate'],
-                    status=UserStatus(result['Status']),
-                    last_login_date=result['LastLoginDate']
+                    user_id=user_id,
+                    username=username,
+                    user_type=_USER_TYPE_BY_VALUE[user_type],
+                    created_date=created_date,
+                    status=_USER_STATUS_BY_VALUE[status],
+                    last_login_date=last_login_date
                 )
             return None
             
@@ -113,87 +340,55 @@ class StudentDAO(BaseDAO):
     def create_student(self, student: Student, user: User) -> str:
         """Create a new student with associated user account"""
         try:
-            # First create user account
-            user_dao = UserDAO()
-            user_id = user_dao.create_user(user)
-            
-            # Then create student record
             query = """
                 INSERT INTO Student (StudentID, UserID, Name, Gender, BirthDate, 
                                    Email, Phone, College, Major, EnrollmentYear)
-                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+                VALUES (%s, LAST_INSERT_ID(), %s, %s, %s, %s, %s, %s, %s, %s)
             """
             params = (
-                student.student_id, user_id, student.name,
+                student.student_id, student.name,
                 student.gender.value if student.gender else None,
                 student.birth_date, student.email, student.phone,
                 student.college, student.major, student.enrollment_year
             )
             
-            self.db.execute_update(query, params)
+            # User and student rows are written and committed together
+            get_dao(UserDAO).create_with_profile(user, query, params)
             return student.student_id
             
         except Exception as e:
             self._handle_db_error("create_student", e)
     
+    @cached_by_id('student')
     def get_student_by_id(self, student_id: str) -> Optional[Student]:
         """Get student by ID"""
         try:
-            query = """
-                SELECT s.*, d.DeptName as CollegeName
+            query = f"""
+                SELECT {_STUDENT_COLUMNS}
                 FROM Student s
-                LEFT JOIN Department d ON s.College = d.DeptID
                 WHERE s.StudentID = %s
             """
-            result = self.db.execute_query(query, (student_id,), fetch_one=True)
+            result = self.db.execute_query(query, (student_id,), fetch_one=True, dictionary=False,
+                                           prepared=True)
             
-            if result:
-                return Student(
-                    student_id=result['StudentID'],
-                    user_id=result['UserID'],
-                    name=result['Name'],
-                    gender=Gender(result['Gender']) if result['Gender'] else None,
-                    birth_date=result['BirthDate'],
-                    email=result['Email'],
-                    phone=result['Phone'],
-                    college=result['College'],
-                    major=result['Major'],
-                    enrollment_year=result['EnrollmentYear'],
-                    created_date=result['CreatedDate'],
-                    updated_date=result['UpdatedDate']
-                )
-            return None
+            return _row_to_student(result) if result else None
             
         except Exception as e:
             self._handle_db_error("get_student_by_id", e)
     
+    @cached_read('profiles', ttl=AppConfig.PROFILE_CACHE_TTL)
     def get_student_by_user_id(self, user_id: int) -> Optional[Student]:
         """Get student by user ID"""
         try:
-            query = """
-                SELECT s.*, d.DeptName as CollegeName
+            query = f"""
+                SELECT {_STUDENT_COLUMNS}
                 FROM Student s
-                LEFT JOIN Department d ON s.College = d.DeptID
                 WHERE s.UserID = %s
             """
-            result = self.db.execute_query(query, (user_id,), fetch_one=True)
+            result = self.db.execute_query(query, (user_id,), fetch_one=True, dictionary=False,
+                                           prepared=True)
             
-            if result:
-                return Student(
-                    student_id=result['StudentID'],
-                    user_id=result['UserID'],
-                    name=result['Name'],
-                    gender=Gender(result['Gender']) if result['Gender'] else None,
-                    birth_date=result['BirthDate'],
-                    email=result['Email'],
-                    phone=result['Phone'],
-                    college=result['College'],
-                    major=result['Major'],
-                    enrollment_year=result['EnrollmentYear'],
-                    created_date=result['CreatedDate'],
-                    updated_date=result['UpdatedDate']
-                )
-            return None
+            return _row_to_student(result) if result else None
             
         except Exception as e:
             self._handle_db_error("get_student_by_user_id", e)
@@ -216,44 +411,47 @@ class StudentDAO(BaseDAO):
             )
             
             rows_affected = self.db.execute_update(query, params)
+            self._forget_identity('student', student.student_id)
+            _invalidate_reads('profiles')
             return rows_affected > 0
             
         except Exception as e:
             self._handle_db_error("update_student", e)
     
-    def get_all_students(self, limit: int = 100, offset: int = 0) -> List[Student]:
-        """Get all students with pagination"""
+    def get_all_students(self, limit: int = 100, offset: int = 0,
+                         after_id: Optional[str] = None) -> List[Student]:
+        """Get all students with pagination
+        
+        With after_id, the page starts after that StudentID (keyset pagination, which reads
+        from the primary key instead of skipping offset rows) and offset is ignored.
+        """
+        return list(self.iter_all_students(limit, offset, after_id))
+    
+    def iter_all_students(self, limit: Optional[int] = None, offset: int = 0,
+                          after_id: Optional[str] = None) -> Iterator[Student]:
+        """Yield students one at a time from an unbuffered cursor (for exports over all rows)"""
         try:
-            query = """
-                SELECT s.*, d.DeptName as CollegeName
+            query = f"""
+                SELECT {_STUDENT_COLUMNS}
                 FROM Student s
-                LEFT JOIN Department d ON s.College = d.DeptID
-                ORDER BY s.StudentID
-                LIMIT %s OFFSET %s
             """
-            results = self.db.execute_query(query, (limit, offset))
-            
-            students = []
-            for result in results:
-                students.append(Student(
-                    student_id=result['StudentID'],
-                    user_id=result['UserID'],
-                    name=result['Name'],
-                    gender=Gender(result['Gender']) if result['Gender'] else None,
-                    birth_date=result['BirthDate'],
-                    email=result['Email'],
-                    phone=result['Phone'],
-                    college=result['College'],
-                    major=result['Major'],
-                    enrollment_year=result['EnrollmentYear'],
-                    created_date=result['CreatedDate'],
-                    updated_date=result['UpdatedDate']
-                ))
-            
-            return students
-            
-        except Exception as e:
-            self._handle_db_error("get_all_students", e)
+            params = []
+            if after_id is not None:
+                query += " WHERE s.StudentID > %s"
+                params.append(after_id)
+            query += " ORDER BY s.StudentID"
+            if limit is not None:
+                query += " LIMIT %s"
+                params.append(limit)
+                if after_id is None:
+                    query += " OFFSET %s"
+                    params.append(offset)
+            
+            for row in self.db.stream_query(query, params, dictionary=False):
+                yield _row_to_student(row)
+            
+        except Exception as e:
+            self._handle_db_error("iter_all_students", e)
 
 class InstructorDAO(BaseDAO):
     """Instructor data access operations"""
@@ -261,80 +459,54 @@ class InstructorDAO(BaseDAO):
     def create_instructor(self, instructor: Instructor, user: User) -> str:
         """Create a new instructor with associated user account"""
         try:
-            # First create user account
-            user_dao = UserDAO()
-            user_id = user_dao.create_user(user)
-            
-            # Then create instructor record
             query = """
                 INSERT INTO Instructor (InstructorID, UserID, Name, Department, 
                                       Email, Phone, Title)
-                VALUES (%s, %s, %s, %s, %s, %s, %s)
+                VALUES (%s, LAST_INSERT_ID(), %s, %s, %s, %s, %s)
             """
             params = (
-                instructor.instructor_id, user_id, instructor.name,
+                instructor.instructor_id, instructor.name,
                 instructor.department, instructor.email, instructor.phone,
                 instructor.title
             )
             
-            self.db.execute_update(query, params)
+            # User and instructor rows are written and committed together
+            get_dao(UserDAO).create_with_profile(user, query, params)
             return instructor.instructor_id
             
         except Exception as e:
             self._handle_db_error("create_instructor", e)
     
+    @cached_by_id('instructor')
     def get_instructor_by_id(self, instructor_id: str) -> Optional[Instructor]:
         """Get instructor by ID"""
         try:
-            query = """
-                SELECT i.*, d.DeptName as DepartmentName
+            query = f"""
+                SELECT {_INSTRUCTOR_COLUMNS}
                 FROM Instructor i
-                LEFT JOIN Department d ON i.Department = d.DeptID
                 WHERE i.InstructorID = %s
             """
-            result = self.db.execute_query(query, (instructor_id,), fetch_one=True)
+            result = self.db.execute_query(query, (instructor_id,), fetch_one=True, dictionary=False,
+                                           prepared=True)
             
-            if result:
-                return Instructor(
-                    instructor_id=result['InstructorID'],
-                    user_id=result['UserID'],
-                    name=result['Name'],
-                    department=result['Department'],
-                    email=result['Email'],
-                    phone=result['Phone'],
-                    title=result['Title'],
-                    created_date=result['CreatedDate'],
-                    updated_date=result['UpdatedDate']
-                )
-            return None
+            return _row_to_instructor(result) if result else None
             
         except Exception as e:
             self._handle_db_error("get_instructor_by_id", e)
     
+    @cached_read('profiles', ttl=AppConfig.PROFILE_CACHE_TTL)
     def get_instructor_by_user_id(self, user_id: int) -> Optional[Instructor]:
         """Get instructor by user ID"""
         try:
-            query = """
-                SELECT i.*, d.DeptName as DepartmentName
+            query = f"""
+                SELECT {_INSTRUCTOR_COLUMNS}
                 FROM Instructor i
-                LEFT JOIN Department d ON i.Department = d.DeptID
                 WHERE i.UserID = %s
             """
-            result = self.db.execute_query(query, (user_id,), fetch_one=True)
+            result = self.db.execute_query(query, (user_id,), fetch_one=True, dictionary=False,
+                                           prepared=True)
             
-            if result:
-                return Instructor(
-                    instructor_id=result['InstructorID'],
-                    user_id=result['UserID'],
-                    name=result['Name'],
-                    department=result['Department'],
-                    email=result['Email'],
-                    phone=result['Phone'],
-                    title=result['Title'],
-                    created_date=result['CreatedDate'],
-                    updated_date=result['UpdatedDate']
-                )
-            return None
+            return _row_to_instructor(result) if result else None
             
         except Exception as e:
             self._handle_db_error("get_instructor_by_user_id", e)
@@ -342,29 +514,14 @@ class InstructorDAO(BaseDAO):
     def get_all_instructors(self) -> List[Instructor]:
         """Get all instructors"""
         try:
-            query = """
-                SELECT i.*, d.DeptName as DepartmentName
+            query = f"""
+                SELECT {_INSTRUCTOR_COLUMNS}
                 FROM Instructor i
-                LEFT JOIN Department d ON i.Department = d.DeptID
                 ORDER BY i.Name
             """
-            results = self.db.execute_query(query)
+            results = self.db.execute_query(query, dictionary=False)
             
-            instructors = []
-            for result in results:
-                instructors.append(Instructor(
-                    instructor_id=result['InstructorID'],
-                    user_id=result['UserID'],
-                    name=result['Name'],
-                    department=result['Department'],
-                    email=result['Email'],
-                    phone=result['Phone'],
-                    title=result['Title'],
-                    created_date=result['CreatedDate'],
-                    updated_date=result['UpdatedDate']
-                ))
-            
-            return instructors
+            return list(map(_row_to_instructor, results))
             
         except Exception as e:
             self._handle_db_error("get_all_instructors", e)
@@ -386,106 +543,96 @@ class CourseDAO(BaseDAO):
             )
             
             self.db.execute_update(query, params)
+            _invalidate_reads('courses')
+            _invalidate_reads('statistics')
             return course.course_id
             
         except Exception as e:
             self._handle_db_error("create_course", e)
     
+    @cached_by_id('course')
     def get_course_by_id(self, course_id: str) -> Optional[Course]:
         """Get course by ID"""
         try:
-            query = """
-                SELECT c.*, d.DeptName as DepartmentName
+            query = f"""
+                SELECT {_COURSE_COLUMNS}
                 FROM Course c
-                LEFT JOIN Department d ON c.Department = d.DeptID
                 WHERE c.CourseID = %s
             """
-            result = self.db.execute_query(query, (course_id,), fetch_one=True)
+            result = self.db.execute_query(query, (course_id,), fetch_one=True, dictionary=False,
+                                           prepared=True)
             
-            if result:
-                return Course(
-                    course_id=result['CourseID'],
-                    course_name=result['CourseName'],
-                    credits=float(result['Credits']),
-                    department=result['Department'],
-                    course_type=CourseType(result['CourseType']),
-                    description=result['Description'],
-                    created_date=result['CreatedDate'],
-                    updated_date=result['UpdatedDate']
-                )
-            return None
+            return _row_to_course(result) if result else None
             
         except Exception as e:
             self._handle_db_error("get_course_by_id", e)
     
+    @cached_read('courses', ttl=AppConfig.COURSE_CACHE_TTL)
+    def get_course_names(self) -> List[Tuple[str, str]]:
+        """Get (CourseID, CourseName) for every course, for pickers that need nothing else"""
+        try:
+            query = "SELECT CourseID, CourseName FROM Course ORDER BY CourseID"
+            return self.db.execute_query(query, dictionary=False)
+            
+        except Exception as e:
+            self._handle_db_error("get_course_names", e)
+    
+    @cached_read('courses', ttl=AppConfig.COURSE_CACHE_TTL)
     def get_all_courses(self, department: str = None) -> List[Course]:
         """Get all courses, optionally filtered by department"""
         try:
             if department:
-                query = """
-                    SELECT c.*, d.DeptName as DepartmentName
+                query = f"""
+                    SELECT {_COURSE_COLUMNS}
                     FROM Course c
-                    LEFT JOIN Department d ON c.Department = d.DeptID
                     WHERE c.Department = %s
                     ORDER BY c.CourseID
                 """
                 params = (department,)
             else:
-                query = """
-                    SELECT c.*, d.DeptName as DepartmentName
+                query = f"""
+                    SELECT {_COURSE_COLUMNS}
                     FROM Course c
-                    LEFT JOIN Department d ON c.Department = d.DeptID
                     ORDER BY c.CourseID
                 """
                 params = None
             
-            results = self.db.execute_query(query, params)
-            
-            courses = []
-            for result in results:
-                courses.append(Course(
-                    course_id=result['CourseID'],
-                    course_name=result['CourseName'],
-                    credits=float(result['Credits']),
-                    department=result['Department'],
-                    course_type=CourseType(result['CourseType']),
-                    description=result['Description'],
-                    created_date=result['CreatedDate'],
-                    updated_date=result['UpdatedDate']
-                ))
+            results = self.db.execute_query(query, params, dictionary=False)
             
-            return courses
+            return list(map(_row_to_course, results))
             
         except Exception as e:
             self._handle_db_error("get_all_courses", e)
     
+    @cached_read('courses', ttl=AppConfig.COURSE_CACHE_TTL)
     def search_courses(self, search_term: str) -> List[Course]:
         """Search courses by name or description"""
         try:
-            query = """
-                SELECT c.*, d.DeptName as DepartmentName
-                FROM Course c
-                LEFT JOIN Department d ON c.Department = d.DeptID
-                WHERE c.CourseName LIKE %s OR c.Description LIKE %s
-                ORDER BY c.CourseID
-            """
-            search_pattern = f"%{search_term}%"
-            results = self.db.execute_query(query, (search_pattern, search_pattern))
+            # Phrase search on the ngram FULLTEXT index keeps LIKE's substring semantics
+            # (including Chinese names) without a table scan
+            phrase = search_term.replace('"', ' ').strip()
+            if len(phrase) >= FULLTEXT_MIN_TERM_LENGTH:
+                query = f"""
+                    SELECT {_COURSE_COLUMNS}
+                    FROM Course c
+                    WHERE MATCH(c.CourseName, c.Description) AGAINST (%s IN BOOLEAN MODE)
+                    ORDER BY c.CourseID
+                """
+                params = (f'"{phrase}"',)
+            else:
+                # Shorter than one ngram token: the index cannot answer it, fall back to LIKE
+                query = f"""
+                    SELECT {_COURSE_COLUMNS}
+                    FROM Course c
+                    WHERE c.CourseName LIKE %s OR c.Description LIKE %s
+                    ORDER BY c.CourseID
+                """
+                search_pattern = f"%{search_term}%"
+                params = (search_pattern, search_pattern)
             
-            courses = []
-            for result in results:
-                courses.append(Course(
-                    course_id=result['CourseID'],
-                    course_name=result['CourseName'],
-                    credits=float(result['Credits']),
-                    department=result['Department'],
-                    course_type=CourseType(result['CourseType']),
-                    description=result['Description'],
-                    created_date=result['CreatedDate'],
-                    updated_date=result['UpdatedDate']
-                ))
+            results = self.db.execute_query(query, params, dictionary=False)
             
-            return courses
+            return list(map(_row_to_course, results))
             
         except Exception as e:
             self._handle_db_error("search_courses", e)
@@ -506,12 +653,9 @@ class SectionDAO(BaseDAO):
                 section.year, section.max_capacity, section.time_slot, section.location
             )
             
-            self.db.execute_update(query, params)
-            
-            # Get the created section ID
-            section_id_query = "SELECT LAST_INSERT_ID()"
-            result = self.db.execute_query(section_id_query, fetch_one=True)
-            return result['LAST_INSERT_ID()']
+            section_id = self.db.execute_insert(query, params)
+            _invalidate_section_listings()
+            return section_id
             
         except Exception as e:
             self._handle_db_error("create_section", e)
@@ -521,66 +665,54 @@ class SectionDAO(BaseDAO):
         try:
             if student_id:
                 # Use stored procedure for student-specific availability
-                results = self.db.call_procedure('sp_GetAvailableSections', [semester, year, student_id])
-            else:
-                # Get all sections with basic availability info
-                query = """
-                    SELECT 
-                        sec.SectionID,
-                        c.CourseID,
-                        c.CourseName,
-                        c.Credits,
-                        c.CourseType,
-                        sec.Semester,
-                        sec.Year,
-                        sec.MaxCapacity,
-                        COALESCE(enrolled.CurrentCount, 0) as CurrentEnrollment,
-                        (sec.MaxCapacity - COALESCE(enrolled.CurrentCount, 0)) as AvailableSpots,
-                        sec.TimeSlot,
-                        sec.Location,
-                        i.Name as InstructorName,
-                        CASE 
-                            WHEN (sec.MaxCapacity - COALESCE(enrolled.CurrentCount, 0)) <= 0 THEN 'Full'
-                            ELSE 'Available'
-                        END as AvailabilityStatus
-                    FROM Section sec
-                    JOIN Course c ON sec.CourseID = c.CourseID
-                    LEFT JOIN Instructor i ON sec.InstructorID = i.InstructorID
-                    LEFT JOIN (
-                        SELECT SectionID, COUNT(*) as CurrentCount
-                        FROM Enrollment 
-                        WHERE Status = 'Enrolled'
-                        GROUP BY SectionID
-                    ) enrolled ON sec.SectionID = enrolled.SectionID
-                    WHERE sec.Semester = %s AND sec.Year = %s
-                    ORDER BY c.CourseID, sec.SectionID
-                """
-                results = self.db.execute_query(query, (semester, year))
-            
-            sections = []
-            for result in results:
-                sections.append(SectionInfo(
-                    section_id=result['SectionID'],
-                    course_id=result['CourseID'],
-                    course_name=result['CourseName'],
-                    credits=float(result['Credits']),
-                    course_type=result['CourseType'],
-                    semester=result['Semester'],
-                    year=result['Year'],
-                    max_capacity=result['MaxCapacity'],
-                    current_enrollment=result['CurrentEnrollment'],
-                    available_spots=result['AvailableSpots'],
-                    time_slot=result['TimeSlot'],
-                    location=result['Location'],
-                    instructor_name=result['InstructorName'],
-                    availability_status=result['AvailabilityStatus']
-                ))
-            
-            return sections
+                sections = _STUDENT_AVAILABILITY_CACHE.get_or_load(
+                    (semester, year, student_id),
+                    lambda: [_row_to_section_info(result) for result in
+                             self.db.call_procedure('sp_GetAvailableSections', [semester, year, student_id])]
+                )
+                return list(sections)
+            
+            # The term listing is the same for every browsing user; serve it from a short-lived cache
+            sections = _SECTION_LISTING_CACHE.get_or_load(
+                (semester, year), lambda: self._load_section_listing(semester, year)
+            )
+            return list(sections)
             
         except Exception as e:
             self._handle_db_error("get_available_sections", e)
     
+    def _load_section_listing(self, semester: str, year: int) -> List[SectionInfo]:
+        """Query every section of a term with basic availability info"""
+        query = """
+            SELECT 
+                sec.SectionID,
+                c.CourseID,
+                c.CourseName,
+                CAST(c.Credits AS DOUBLE) AS Credits,
+                c.CourseType,
+                sec.Semester,
+                sec.Year,
+                sec.MaxCapacity,
+                COALESCE(ss.CurrentEnrollment, 0) as CurrentEnrollment,
+                (sec.MaxCapacity - COALESCE(ss.CurrentEnrollment, 0)) as AvailableSpots,
+                sec.TimeSlot,
+                sec.Location,
+                i.Name as InstructorName,
+                CASE 
+                    WHEN (sec.MaxCapacity - COALESCE(ss.CurrentEnrollment, 0)) <= 0 THEN 'Full'
+                    ELSE 'Available'
+                END as AvailabilityStatus
+            FROM Section sec
+            JOIN Course c ON sec.CourseID = c.CourseID
+            LEFT JOIN Instructor i ON sec.InstructorID = i.InstructorID
+            LEFT JOIN SectionStats ss ON ss.SectionID = sec.SectionID
+            WHERE sec.Semester = %s AND sec.Year = %s
+            ORDER BY c.CourseID, sec.SectionID
+        """
+        # Columns are selected in SectionInfo field order, so tuple rows unpack positionally
+        results = self.db.execute_query(query, (semester, year), dictionary=False, prepared=True)
+        return [SectionInfo(*row) for row in results]
+    
     def get_section_by_id(self, section_id: int) -> Optional[SectionInfo]:
         """Get section by ID with detailed information"""
         try:
@@ -589,46 +721,27 @@ class SectionDAO(BaseDAO):
                     sec.SectionID,
                     c.CourseID,
                     c.CourseName,
-                    c.Credits,
+                    CAST(c.Credits AS DOUBLE) AS Credits,
                     c.CourseType,
                     sec.Semester,
                     sec.Year,
                     sec.MaxCapacity,
-                    COALESCE(enrolled.CurrentCount, 0) as CurrentEnrollment,
-                    (sec.MaxCapacity - COALESCE(enrolled.CurrentCount, 0)) as AvailableSpots,
+                    COALESCE(ss.CurrentEnrollment, 0) as CurrentEnrollment,
+                    (sec.MaxCapacity - COALESCE(ss.CurrentEnrollment, 0)) as AvailableSpots,
                     sec.TimeSlot,
                     sec.Location,
                     i.Name as InstructorName
                 FROM Section sec
                 JOIN Course c ON sec.CourseID = c.CourseID
                 LEFT JOIN Instructor i ON sec.InstructorID = i.InstructorID
-                LEFT JOIN (
-                    SELECT SectionID, COUNT(*) as CurrentCount
-                    FROM Enrollment 
-                    WHERE Status = 'Enrolled'
-                    GROUP BY SectionID
-                ) enrolled ON sec.SectionID = enrolled.SectionID
+                LEFT JOIN SectionStats ss ON ss.SectionID = sec.SectionID
                 WHERE sec.SectionID = %s
             """
-            result = self.db.execute_query(query, (section_id,), fetch_one=True)
+            # Columns in SectionInfo field order; availability_status keeps its default
+            result = self.db.execute_query(query, (section_id,), fetch_one=True, dictionary=False,
+                                           prepared=True)
             
-            if result:
-                return SectionInfo(
-                    section_id=result['SectionID'],
-                    course_id=result['CourseID'],
-                    course_name=result['CourseName'],
-                    credits=float(result['Credits']),
-                    course_type=result['CourseType'],
-                    semester=result['Semester'],
-                    year=result['Year'],
-                    max_capacity=result['MaxCapacity'],
-                    current_enrollment=result['CurrentEnrollment'],
-                    available_spots=result['AvailableSpots'],
-                    time_slot=result['TimeSlot'],
-                    location=result['Location'],
-                    instructor_name=result['InstructorName']
-                )
-            return None
+            return SectionInfo(*result) if result else None
             
         except Exception as e:
             self._handle_db_error("get_section_by_id", e)
@@ -639,17 +752,16 @@ class EnrollmentDAO(BaseDAO):
     def enroll_student(self, student_id: str, section_id: int) -> Tuple[bool, str]:
         """Enroll student in a section using stored procedure"""
         try:
-            # Call stored procedure
-            query = "CALL sp_EnrollStudent(%s, %s, @result, @success)"
-            self.db.execute_update(query, (student_id, section_id))
-            
-            # Get results
-            result_query = "SELECT @result as result, @success as success"
-            result = self.db.execute_query(result_query, fetch_one=True)
+            # Call stored procedure; its OUT values come back in the same round trip
+            result = self.db.call_procedure_outputs('sp_EnrollStudent', (student_id, section_id),
+                                                    ('result', 'success'))
             
             success = result['success'] == 1 if result['success'] is not None else False
             message = result['result'] or "Unknown error"
             
+            if success:
+                _invalidate_section_listings()
+                _invalidate_reads('statistics')
             return success, message
             
         except Exception as e:
@@ -668,6 +780,9 @@ class EnrollmentDAO(BaseDAO):
                 WHERE StudentID = %s AND SectionID = %s AND Status = 'Enrolled'
             """
             rows_affected = self.db.execute_update(query, (student_id, section_id))
+            if rows_affected > 0:
+                _invalidate_section_listings()
+                _invalidate_reads('statistics')
             return rows_affected > 0
             
         except Exception as e:
@@ -676,165 +791,122 @@ class EnrollmentDAO(BaseDAO):
     def update_grade(self, enrollment_id: int, final_grade: float) -> bool:
         """Update student's final grade"""
         try:
-            # Calculate grade points
-            grade_points = AppConfig.calculate_grade_points(final_grade)
-            
-            query = """
-                UPDATE Enrollment 
-                SET FinalGrade = %s, GradePoints = %s,
-                    Status = CASE WHEN %s >= 60 THEN 'Completed' ELSE 'Failed' END
-                WHERE EnrollmentID = %s
-            """
-            params = (final_grade, grade_points, final_grade, enrollment_id)
-            rows_affected = self.db.execute_update(query, params)
+            # GradePoints is a generated column and trg_enrollment_grade_bu sets the
+            # Completed/Failed status, so only the grade itself is written
+            query = "UPDATE Enrollment SET FinalGrade = %s WHERE EnrollmentID = %s"
+            rows_affected = self.db.execute_update(query, (final_grade, enrollment_id))
+            if rows_affected > 0:
+                # Grading moves the row out of 'Enrolled', which frees a seat in the listing
+                _invalidate_section_listings()
+                _invalidate_reads('statistics')
             return rows_affected > 0
             
         except Exception as e:
             self._handle_db_error("update_grade", e)
     
-    def get_student_enrollments(self, student_id: str, semester: str = None, year: int = None) -> List[EnrollmentInfo]:
-        """Get student's enrollment information"""
+    def get_student_enrollments(self, student_id: str, semester: str = None, year: int = None,
+                                status: EnrollmentStatus = None) -> List[EnrollmentInfo]:
+        """Get student's enrollment information, optionally only those in one status"""
         try:
-            base_query = """
-                SELECT 
-                    e.EnrollmentID,
-                    e.StudentID,
-                    s.Name as StudentName,
-                    c.CourseID,
-                    c.CourseName,
-                    c.Credits,
-                    sec.SectionID,
-                    sec.Semester,
-                    sec.Year,
-                    sec.TimeSlot,
-                    sec.Location,
-                    i.Name as InstructorName,
-                    e.Status,
-                    e.FinalGrade,
-                    e.GradePoints,
-                    e.EnrollmentDate
-                FROM Enrollment e
-                JOIN Student s ON e.StudentID = s.StudentID
-                JOIN Section sec ON e.SectionID = sec.SectionID
-                JOIN Course c ON sec.CourseID = c.CourseID
-                LEFT JOIN Instructor i ON sec.InstructorID = i.InstructorID
-                WHERE e.StudentID = %s
-            """
-            
+            query = _ENROLLMENT_INFO_QUERY + " WHERE e.StudentID = %s"
             params = [student_id]
             
             if semester and year:
-                base_query += " AND sec.Semester = %s AND sec.Year = %s"
+                query += " AND sec.Semester = %s AND sec.Year = %s"
                 params.extend([semester, year])
             
-            base_query += " ORDER BY sec.Year DESC, sec.Semester, c.CourseID"
-            
-            results = self.db.execute_query(base_query, params)
-            
-            enrollments = []
-            for result in results:
-                enrollments.append(EnrollmentInfo(
-                    enrollment_id=result['EnrollmentID'],
-                    student_id=result['StudentID'],
-                    student_name=result['StudentName'],
-                    course_id=result['CourseID'],
-                    course_name=result['CourseName'],
-                    credits=float(result['Credits']),
-                    section_id=result['SectionID'],
-                    semester=result['Semester'],
-                    year=result['Year'],
-                    time_slot=result['TimeSlot'],
-                    location=result['Location'],
-                    instructor_name=result['InstructorName'],
-                    status=result['Status'],
-                    final_grade=float(result['FinalGrade']) if result['FinalGrade'] else None,
-                    grade_points=float(result['GradePoints']) if result['GradePoints'] else None,
-                    enrollment_date=result['EnrollmentDate']
-                ))
-            
-            return enrollments
+            if status:
+                query += " AND e.Status = %s"
+                params.append(status.value)
+            
+            query += " ORDER BY sec.Year DESC, sec.Semester, c.CourseID"
+            
+            results = self.db.execute_query(query, params, dictionary=False, prepared=True)
+            return list(map(_row_to_enrollment_info, results))
             
         except Exception as e:
             self._handle_db_error("get_student_enrollments", e)
     
-    def get_section_enrollments(self, section_id: int) -> List[EnrollmentInfo]:
-        """Get all enrollments for a section"""
+    def eligibility_probe(self, student_id: str, section_id: int) -> Optional[Tuple]:
+        """Check a section against the student's enrollments in the same term with one query
+        
+        Returns (available_spots, credits, current_credits, term_enrollments, has_conflict,
+        already_enrolled), or None when the section does not exist.
+        """
         try:
             query = """
-                SELECT 
-                    e.EnrollmentID,
-                    e.StudentID,
-                    s.Name as StudentName,
-                    c.CourseID,
-                    c.CourseName,
-                    c.Credits,
-                    sec.SectionID,
-                    sec.Semester,
-                    sec.Year,
-                    sec.TimeSlot,
-                    sec.Location,
-                    i.Name as InstructorName,
-                    e.Status,
-                    e.FinalGrade,
-                    e.GradePoints,
-                    e.EnrollmentDate
-                FROM Enrollment e
-                JOIN Student s ON e.StudentID = s.StudentID
-                JOIN Section sec ON e.SectionID = sec.SectionID
+                SELECT sec.MaxCapacity - COALESCE(ss.CurrentEnrollment, 0) AS AvailableSpots,
+                       CAST(c.Credits AS DOUBLE) AS Credits,
+                       CAST(COALESCE(SUM(CASE WHEN e.Status = 'Enrolled' THEN ec.Credits END), 0)
+                            AS DOUBLE) AS CurrentCredits,
+                       COUNT(e.EnrollmentID) AS TermEnrollments,
+                       COALESCE(SUM(e.Status = 'Enrolled' AND es.TimeSlot = sec.TimeSlot), 0) > 0
+                           AS HasConflict,
+                       COALESCE(SUM(e.SectionID = sec.SectionID), 0) > 0 AS AlreadyEnrolled
+                FROM Section sec
                 JOIN Course c ON sec.CourseID = c.CourseID
-                LEFT JOIN Instructor i ON sec.InstructorID = i.InstructorID
-                WHERE e.SectionID = %s
-                ORDER BY s.Name
+                LEFT JOIN SectionStats ss ON ss.SectionID = sec.SectionID
+                LEFT JOIN (Enrollment e
+                           JOIN Section es ON e.SectionID = es.SectionID
+                           JOIN Course ec ON es.CourseID = ec.CourseID)
+                       ON e.StudentID = %s AND es.Semester = sec.Semester AND es.Year = sec.Year
+                WHERE sec.SectionID = %s
+                GROUP BY sec.SectionID, sec.MaxCapacity, ss.CurrentEnrollment, c.Credits
             """
+            result = self.db.execute_query(query, (student_id, section_id), fetch_one=True,
+                                           dictionary=False, prepared=True)
+            if not result:
+                return None
+            
+            available_spots, credits, current_credits, term_enrollments, has_conflict, already_enrolled = result
+            return (available_spots, credits, current_credits, term_enrollments,
+                    bool(has_conflict), bool(already_enrolled))
             
-            results = self.db.execute_query(query, (section_id,))
-            
-            enrollments = []
-            for result in results:
-                enrollments.append(EnrollmentInfo(
-                    enrollment_id=result['EnrollmentID'],
-                    student_id=result['StudentID'],
-                    student_name=result['StudentName'],
-                    course_id=result['CourseID'],
-                    course_name=result['CourseName'],
-                    credits=float(result['Credits']),
-                    section_id=result['SectionID'],
-                    semester=result['Semester'],
-                    year=result['Year'],
-                    time_slot=result['TimeSlot'],
-                    location=result['Location'],
-                    instructor_name=result['InstructorName'],
-                    status=result['Status'],
-                    final_grade=float(result['FinalGrade']) if result['FinalGrade'] else None,
-                    grade_points=float(result['GradePoints']) if result['GradePoints'] else None,
-                    enrollment_date=result['EnrollmentDate']
-                ))
-            
-            return enrollments
+        except Exception as e:
+            self._handle_db_error("eligibility_probe", e)
+    
+    SECTION_ENROLLMENTS_QUERY = _ENROLLMENT_INFO_QUERY + " WHERE e.SectionID = %s ORDER BY s.Name"
+    # Enrollments an instructor can grade: still enrolled, or completed and open to correction
+    GRADABLE_ENROLLMENTS_QUERY = (_ENROLLMENT_INFO_QUERY +
+                                  " WHERE e.SectionID = %s AND e.Status IN ('Enrolled', 'Completed')"
+                                  " ORDER BY s.Name")
+    
+    def get_section_enrollments(self, section_id: int) -> List[EnrollmentInfo]:
+        """Get all enrollments for a section"""
+        try:
+            results = self.db.execute_query(self.SECTION_ENROLLMENTS_QUERY, (section_id,),
+                                            dictionary=False, prepared=True)
+            return list(map(_row_to_enrollment_info, results))
             
         except Exception as e:
             self._handle_db_error("get_section_enrollments", e)
+    
+    def get_gradable_enrollments(self, section_id: int) -> List[EnrollmentInfo]:
+        """Get a section's enrollments whose grade can be entered or changed"""
+        try:
+            results = self.db.execute_query(self.GRADABLE_ENROLLMENTS_QUERY, (section_id,),
+                                            dictionary=False, prepared=True)
+            return list(map(_row_to_enrollment_info, results))
+            
+        except Exception as e:
+            self._handle_db_error("get_gradable_enrollments", e)
 
 class DepartmentDAO(BaseDAO):
     """Department data access operations"""
     
+    @cached_read('departments')
     def get_all_departments(self) -> List[Department]:
         """Get all departments"""
         try:
-            query = "SELECT * FROM Department ORDER BY DeptName"
-            results = self.db.execute_query(query)
-            
-            departments = []
-            for result in results:
-                departments.append(Department(
-                    dept_id=result['DeptID'],
-                    dept_name=result['DeptName'],
-                    dept_head=result['DeptHead'],
-                    created_date=result['CreatedDate'],
-                    updated_date=result['UpdatedDate']
-                ))
+            # Columns in Department field order
+            query = """
+                SELECT DeptID, DeptName, DeptHead, CreatedDate, UpdatedDate
+                FROM Department
+                ORDER BY DeptName
+            """
+            results = self.db.execute_query(query, dictionary=False)
             
-            return departments
+            return [Department(*row) for row in results]
             
         except Exception as e:
             self._handle_db_error("get_all_departments", e)
@@ -849,6 +921,8 @@ class DepartmentDAO(BaseDAO):
             params = (department.dept_id, department.dept_name, department.dept_head)
             
             self.db.execute_update(query, params)
+            _invalidate_reads('departments')
+            _invalidate_reads('statistics')
             return department.dept_id
             
         except Exception as e:
@@ -857,68 +931,105 @@ class DepartmentDAO(BaseDAO):
 class StatisticsDAO(BaseDAO):
     """Statistics and reporting data access operations"""
     
+    @cached_read('statistics')
     def get_student_gpa(self, student_id: str) -> Optional[StudentGPA]:
         """Get student's GPA information"""
         try:
-            # Use stored procedure
-            query = "CALL sp_CalculateGPA(%s, @gpa, @total_credits)"
-            self.db.execute_update(query, (student_id,))
-            
-            # Get results
-            result_query = "SELECT @gpa as gpa, @total_credits as total_credits"
-            result = self.db.execute_query(result_query, fetch_one=True)
+            return self.get_many_student_gpas([student_id]).get(student_id)
             
-            # Get additional student info
-            student_query = """
-                SELECT s.Name,
+        except Exception as e:
+            self._handle_db_error("get_student_gpa", e)
+    
+    def get_many_student_gpas(self, student_ids: List[str]) -> Dict[str, StudentGPA]:
+        """Get GPA information for many students with a single query"""
+        try:
+            if not student_ids:
+                return {}
+            
+            # Credit-weighted GPA over completed, graded enrollments (the sp_CalculateGPA
+            # formula), computed alongside the course counts in the same grouped scan
+            placeholders = ', '.join(['%s'] * len(student_ids))
+            query = f"""
+                SELECT s.StudentID, s.Name,
+                       CAST(COALESCE(ROUND(SUM(CASE WHEN e.Status = 'Completed' AND e.GradePoints IS NOT NULL
+                                                    THEN e.GradePoints * c.Credits END)
+                                           / SUM(CASE WHEN e.Status = 'Completed' AND e.GradePoints IS NOT NULL
+                                                      THEN c.Credits END), 2), 0) AS DOUBLE) AS GPA,
+                       CAST(COALESCE(SUM(CASE WHEN e.Status = 'Completed' AND e.GradePoints IS NOT NULL
+                                              THEN c.Credits END), 0) AS DOUBLE) AS TotalCredits,
                        COUNT(e.EnrollmentID) as TotalCourses,
                        COUNT(CASE WHEN e.Status = 'Completed' THEN 1 END) as CompletedCourses
                 FROM Student s
                 LEFT JOIN Enrollment e ON s.StudentID = e.StudentID
-                WHERE s.StudentID = %s
+                LEFT JOIN Section sec ON e.SectionID = sec.SectionID
+                LEFT JOIN Course c ON sec.CourseID = c.CourseID
+                WHERE s.StudentID IN ({placeholders})
                 GROUP BY s.StudentID, s.Name
             """
-            student_info = self.db.execute_query(student_query, (student_id,), fetch_one=True)
+            results = self.db.execute_query(query, list(student_ids), dictionary=False)
             
-            if student_info:
-                return StudentGPA(
+            return {
+                student_id: StudentGPA(
                     student_id=student_id,
-                    student_name=student_info['Name'],
-                    total_credits=float(result['total_credits']) if result['total_credits'] else 0.0,
-                    completed_credits=float(result['total_credits']) if result['total_credits'] else 0.0,
-                    gpa=float(result['gpa']) if result['gpa'] else 0.0,
-                    total_courses=student_info['TotalCourses'],
-                    completed_courses=student_info['CompletedCourses']
+                    student_name=name,
+                    total_credits=total_credits,
+                    completed_credits=total_credits,
+                    gpa=gpa,
+                    total_courses=total_courses,
+                    completed_courses=completed_courses
                 )
-            return None
+                for student_id, name, gpa, total_credits, total_courses, completed_courses in results
+            }
             
         except Exception as e:
-            self._handle_db_error("get_student_gpa", e)
+            self._handle_db_error("get_many_student_gpas", e)
+    
+    @cached_read('statistics')
+    def get_system_counts(self) -> Dict[str, int]:
+        """Get row counts of the main tables in one round trip"""
+        try:
+            query = """
+                SELECT (SELECT COUNT(*) FROM Student) AS total_students,
+                       (SELECT COUNT(*) FROM Instructor) AS total_instructors,
+                       (SELECT COUNT(*) FROM Department) AS total_departments,
+                       (SELECT COUNT(*) FROM Course) AS total_courses,
+                       (SELECT COUNT(*) FROM Enrollment) AS total_enrollments
+            """
+            return self.db.execute_query(query, fetch_one=True)
+            
+        except Exception as e:
+            self._handle_db_error("get_system_counts", e)
     
+    # One grouped scan over the enrollments, in CourseStatistics field order. PassCount/FailCount
+    # use the same 60-point pass mark as RULES.passing; conditional SUMs are cast back to integers
+    COURSE_STATISTICS_QUERY = """
+        SELECT c.CourseID, c.CourseName, CAST(c.Credits AS DOUBLE) AS Credits, c.Department,
+               COALESCE(d.DeptName, '') AS DeptName,
+               COUNT(e.EnrollmentID) AS TotalEnrollments,
+               CAST(COALESCE(SUM(e.Status = 'Enrolled'), 0) AS SIGNED) AS CurrentEnrollments,
+               CAST(COALESCE(SUM(e.Status = 'Completed'), 0) AS SIGNED) AS CompletedEnrollments,
+               CAST(ROUND(AVG(e.FinalGrade), 2) AS DOUBLE) AS AverageGrade,
+               CAST(COALESCE(SUM(e.FinalGrade >= 60), 0) AS SIGNED) AS PassCount,
+               CAST(COALESCE(SUM(e.FinalGrade < 60), 0) AS SIGNED) AS FailCount,
+               CAST(ROUND(100 * SUM(e.FinalGrade >= 60) / COUNT(e.FinalGrade), 2) AS DOUBLE) AS PassRate
+        FROM Course c
+        LEFT JOIN Department d ON c.Department = d.DeptID
+        LEFT JOIN Section sec ON sec.CourseID = c.CourseID
+        LEFT JOIN Enrollment e ON e.SectionID = sec.SectionID
+        GROUP BY c.CourseID, c.CourseName, c.Credits, c.Department, d.DeptName
+        ORDER BY c.CourseID
+    """
+    
+    @cached_read('statistics')
     def get_course_statistics(self) -> List[CourseStatistics]:
-        """Get course statistics from view"""
-        try:
-            query = "SELECT * FROM CourseStatistics ORDER BY CourseID"
-            results = self.db.execute_query(query)
-            
-            statistics = []
-            for result in results:
-                statistics.append(CourseStatistics(
-                    course_id=result['CourseID'],
-                    course_name=result['CourseName'],
-                    credits=float(result['Credits']),
-                    department=result['Department'],
-                    dept_name=result['DeptName'] or '',
-                    total_enrollments=result['TotalEnrollments'],
-                    current_enrollments=result['CurrentEnrollments'],
-                    completed_enrollments=result['CompletedEnrollments'],
-                    average_grade=float(result['AverageGrade']) if result['AverageGrade'] else None,
-                    pass_count=result['PassCount'],
-                    fail_count=result['FailCount'],
-                    pass_rate=float(result['PassRate']) if result['PassRate'] else None
-                ))
-            
-            return statistics
-            
-        except Exception as e:
-            self._handle_db_error("get_course_statistics", e)
\ No newline at end of file
+        """Get per-course enrollment statistics"""
+        return list(self.iter_course_statistics())
+    
+    def iter_course_statistics(self) -> Iterator[CourseStatistics]:
+        """Yield per-course enrollment statistics one row at a time"""
+        try:
+            for row in self.db.stream_query(self.COURSE_STATISTICS_QUERY, dictionary=False):
+                yield CourseStatistics(*row)
+            
+        except Exception as e:
+            self._handle_db_error("iter_course_statistics", e)
\ No newline at end of file
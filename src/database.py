@@ -4,8 +4,13 @@ University Course Registration and Grade Management System
 """
 
 import mysql.connector
-from mysql.connector import pooling, Error
+from mysql.connector import pooling, Error, HAVE_CEXT
 import logging
+import sys
+import threading
+import weakref
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 from config import DatabaseConfig
 
@@ -17,17 +22,36 @@ class DatabaseManager:
     """Database connection and transaction management"""
     
     def __init__(self):
+        # Created on first use (see _get_pool) so importing this module opens no connections
         self.connection_pool = None
-        self._initialize_pool()
+        self._pool_lock = threading.Lock()
+        # Per-connection LRU of server-side prepared cursors: raw connection -> (session id, cursors)
+        self._statement_caches = weakref.WeakKeyDictionary()
+        self._statement_lock = threading.Lock()
+    
+    def _get_pool(self):
+        """Return the connection pool, creating it on first call"""
+        pool = self.connection_pool
+        if pool is None:
+            with self._pool_lock:
+                if self.connection_pool is None:
+                    self._initialize_pool()
+                pool = self.connection_pool
+        return pool
     
     def _initialize_pool(self):
         """Initialize database connection pool"""
         try:
-            config = DatabaseConfig.get_connection_config()
+            config = dict(DatabaseConfig.get_connection_config())
+            if not HAVE_CEXT:
+                # C extension not built for this platform; fall back to the pure driver
+                config['use_pure'] = True
+                logger.warning("mysql-connector C extension unavailable; using the pure-Python protocol")
             self.connection_pool = pooling.MySQLConnectionPool(**config)
-            logger.info("Database connection pool initialized successfully")
+            logger.info("Database connection pool initialized successfully (size %s, C extension: %s)",
+                        config['pool_size'], not config['use_pure'])
         except Error as e:
-            logger.error(f"Error creating connection pool: {e}")
+            logger.error("Error creating connection pool: %s", e)
             raise
     
     @contextmanager
@@ -35,35 +59,95 @@ class DatabaseManager:
         """Get database connection from pool with context manager"""
         connection = None
         try:
-            connection = self.connection_pool.get_connection()
+            connection = self._get_pool().get_connection()
             yield connection
         except Error as e:
             if connection:
                 connection.rollback()
-            logger.error(f"Database connection error: {e}")
+            logger.error("Database connection error: %s", e)
             raise
         finally:
-            if connection and connection.is_connected():
-                connection.close()
+            if connection:
+                self._release_connection(connection)
+    
+    def _release_connection(self, connection):
+        """Return a connection to the pool, discarding any unfinished transaction"""
+        try:
+            # Sessions are not reset on release, so end any transaction left open by a failed
+            # or unfinished multi-statement write before the next borrower gets it
+            if connection.is_connected() and connection.in_transaction:
+                connection.rollback()
+        except Error as e:
+            logger.warning("Rollback on release failed: %s", e)
+        finally:
+            # Disconnected connections go back too; the pool reconnects them on checkout
+            connection.close()
     
     @contextmanager
-    def get_cursor(self, dictionary=True):
-        """Get database cursor with context manager"""
+    def get_cursor(self, dictionary=True, prepared_query=None):
+        """Get database cursor with context manager
+        
+        With prepared_query, the cursor is this connection's cached server-side
+        prepared statement for that SQL and is kept open for reuse.
+        """
         with self.get_connection() as connection:
-            cursor = connection.cursor(dictionary=dictionary)
+            if prepared_query is None:
+                cursor = connection.cursor(dictionary=dictionary)
+            else:
+                cursor = self._get_prepared_cursor(connection, prepared_query, dictionary)
             try:
                 yield cursor, connection
             except Error as e:
                 connection.rollback()
-                logger.error(f"Database cursor error: {e}")
+                logger.error("Database cursor error: %s", e)
                 raise
             finally:
-                cursor.close()
+                if prepared_query is None:
+                    cursor.close()
+    
+    def _get_prepared_cursor(self, connection, query, dictionary):
+        """Return the prepared cursor cached on this connection for query, creating it if needed"""
+        # PooledMySQLConnection is a fresh wrapper per checkout; cache on the connection it wraps
+        raw_connection = getattr(connection, '_cnx', connection)
+        connection_id = raw_connection.connection_id
+        with self._statement_lock:
+            cached_id, cursors = self._statement_caches.get(raw_connection, (None, None))
+            if cached_id != connection_id:
+                # New or reconnected session: statements prepared on the old one no longer exist
+                cursors = OrderedDict()
+                self._statement_caches[raw_connection] = (connection_id, cursors)
+        
+        key = (query, dictionary)
+        cursor = cursors.get(key)
+        if cursor is None:
+            cursor = connection.cursor(prepared=True, dictionary=dictionary)
+            cursors[key] = cursor
+            if len(cursors) > DatabaseConfig.STATEMENT_CACHE_SIZE:
+                _, evicted = cursors.popitem(last=False)
+                evicted.close()
+        else:
+            cursors.move_to_end(key)
+        return cursor
+    
+    def _cursor_context(self, query, dictionary=True, prepared=False):
+        """Open a plain or prepared cursor for query; returns (context manager, query to execute)"""
+        if not prepared:
+            return self.get_cursor(dictionary=dictionary), query
+        # The driver reuses a prepared statement only when handed the identical str object,
+        # so equal SQL text is interned to one object per statement
+        query = sys.intern(query)
+        return self.get_cursor(dictionary=dictionary, prepared_query=query), query
     
-    def execute_query(self, query, params=None, fetch_one=False, fetch_all=True):
-        """Execute SELECT query and return results"""
+    def execute_query(self, query, params=None, fetch_one=False, fetch_all=True, dictionary=True,
+                      prepared=False):
+        """Execute SELECT query and return results (dict rows, or tuples with dictionary=False)
+        
+        prepared=True runs the query as a cached server-side prepared statement; use it
+        only for fixed SQL text whose values are all passed as params.
+        """
         try:
-            with self.get_cursor() as (cursor, connection):
+            cursor_context, query = self._cursor_context(query, dictionary, prepared)
+            with cursor_context as (cursor, connection):
                 cursor.execute(query, params or ())
                 
                 if fetch_one:
@@ -73,35 +157,90 @@ class DatabaseManager:
                 else:
                     return cursor.rowcount
         except Error as e:
-            logger.error(f"Query execution error: {e}")
+            logger.error("Query execution error: %s", e)
             raise
     
-    def execute_update(self, query, params=None, commit=True):
+    def stream_query(self, query, params=None, dictionary=True, batch_size=500):
+        """Yield rows of a SELECT as they arrive from the server instead of materializing them
+        
+        The cursor is unbuffered, so at most batch_size rows are held client-side. The pooled
+        connection stays checked out until the generator is exhausted or closed.
+        """
+        try:
+            with self.get_cursor(dictionary=dictionary) as (cursor, connection):
+                cursor.execute(query, params or ())
+                while True:
+                    rows = cursor.fetchmany(batch_size)
+                    if not rows:
+                        break
+                    yield from rows
+        except Error as e:
+            logger.error("Streaming query error: %s", e)
+            raise
+    
+    def execute_update(self, query, params=None, commit=True, prepared=False):
         """Execute INSERT, UPDATE, DELETE query"""
         try:
-            with self.get_cursor() as (cursor, connection):
+            cursor_context, query = self._cursor_context(query, prepared=prepared)
+            with cursor_context as (cursor, connection):
                 cursor.execute(query, params or ())
                 
-                if commit:
+                if commit and connection.in_transaction:
                     connection.commit()
                 
                 return cursor.rowcount
         except Error as e:
-            logger.error(f"Update execution error: {e}")
+            logger.error("Update execution error: %s", e)
+            raise
+    
+    def execute_insert(self, query, params=None, commit=True):
+        """Execute INSERT query and return the generated AUTO_INCREMENT id"""
+        try:
+            with self.get_cursor() as (cursor, connection):
+                cursor.execute(query, params or ())
+                
+                if commit and connection.in_transaction:
+                    connection.commit()
+                
+                return cursor.lastrowid
+        except Error as e:
+            logger.error("Insert execution error: %s", e)
+            raise
+    
+    def execute_multi(self, query, params=None, commit=True):
+        """Execute several ';'-separated statements in one round trip on one session
+        
+        Returns the rows of every statement that produced a result set, in order.
+        """
+        try:
+            with self.get_cursor() as (cursor, connection):
+                result_sets = []
+                for result in cursor.execute(query, params or (), multi=True):
+                    if result.with_rows:
+                        result_sets.append(result.fetchall())
+                
+                if commit and connection.in_transaction:
+                    connection.commit()
+                
+                return result_sets
+        except Error as e:
+            logger.error("Multi-statement execution error: %s", e)
             raise
     
     def execute_many(self, query, params_list, commit=True):
         """Execute multiple queries with different parameters"""
         try:
             with self.get_cursor() as (cursor, connection):
+                # executemany may split into several statements; keep the batch atomic
+                connection.start_transaction()
                 cursor.executemany(query, params_list)
                 
-                if commit:
+                if commit and connection.in_transaction:
                     connection.commit()
                 
                 return cursor.rowcount
         except Error as e:
-            logger.error(f"Batch execution error: {e}")
+            logger.error("Batch execution error: %s", e)
             raise
     
     def call_procedure(self, proc_name, params=None):
@@ -115,10 +254,27 @@ class DatabaseManager:
                 for result in cursor.stored_results():
                     results.extend(result.fetchall())
                 
-                connection.commit()
+                if connection.in_transaction:
+                    connection.commit()
                 return results
         except Error as e:
-            logger.error(f"Procedure call error: {e}")
+            logger.error("Procedure call error: %s", e)
+            raise
+    
+    def call_procedure_outputs(self, proc_name, params, out_names):
+        """Call a stored procedure and return its OUT parameters as a dict
+        
+        The CALL and the SELECT of the session variables holding the OUT values are sent
+        as one multi-statement round trip on the same connection.
+        """
+        out_vars = [f"@_{proc_name}_{name}" for name in out_names]
+        placeholders = ', '.join(['%s'] * len(params) + out_vars)
+        selected = ', '.join(f"{var} AS {name}" for var, name in zip(out_vars, out_names))
+        query = f"CALL {proc_name}({placeholders}); SELECT {selected}"
+        try:
+            return self.execute_multi(query, params)[-1][0]
+        except Error as e:
+            logger.error("Procedure call error: %s", e)
             raise
     
     def test_connection(self):
@@ -132,8 +288,51 @@ class DatabaseManager:
                     cursor.close()
                     return result[0] == 1
         except Error as e:
-            logger.error(f"Connection test failed: {e}")
+            logger.error("Connection test failed: %s", e)
+            return False
+    
+    def missing_grade_objects(self):
+        """Return the names of the grade-derivation objects update_grade relies on that do not exist"""
+        query = """
+            SELECT
+                (SELECT COUNT(*) FROM information_schema.COLUMNS
+                 WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = 'Enrollment'
+                   AND COLUMN_NAME = 'GradePoints' AND GENERATION_EXPRESSION <> ''),
+                (SELECT COUNT(*) FROM information_schema.TRIGGERS
+                 WHERE TRIGGER_SCHEMA = DATABASE() AND TRIGGER_NAME = 'trg_enrollment_grade_bu')
+        """
+        has_column, has_trigger = self.execute_query(query, fetch_one=True, dictionary=False)
+        missing = []
+        if not has_column:
+            missing.append("Enrollment.GradePoints generated column")
+        if not has_trigger:
+            missing.append("trg_enrollment_grade_bu trigger")
+        return missing
+    
+    def prewarm_pool(self, count=None):
+        """Check pooled connections out once, in parallel, so they are not cold on first use"""
+        pool_size = self._get_pool().pool_size
+        count = min(pool_size, count or DatabaseConfig.POOL_MIN or pool_size)
+        with ThreadPoolExecutor(max_workers=count) as executor:
+            warmed = sum(executor.map(self._warm_connection, range(count)))
+        logger.info("Connection pool pre-warmed (%s/%s connections ready)", warmed, count)
+        return warmed
+    
+    def _warm_connection(self, _index):
+        """Borrow one pooled connection, make sure it is live and hand it back"""
+        try:
+            connection = self._get_pool().get_connection()
+        except Error as e:
+            logger.warning("Connection pre-warm skipped: %s", e)
+            return False
+        try:
+            connection.ping(reconnect=True, attempts=1, delay=0)
+            return True
+        except Error as e:
+            logger.warning("Connection pre-warm failed: %s", e)
             return False
+        finally:
+            connection.close()
     
     def close_pool(self):
         """Close all connections in the pool"""
@@ -144,7 +343,7 @@ class DatabaseManager:
                 self.connection_pool = None
                 logger.info("Database connection pool closed")
             except Exception as e:
-                logger.error(f"Error closing connection pool: {e}")
+                logger.error("Error closing connection pool: %s", e)
 
 # Global database manager instance
 db_manager = DatabaseManager()
\ No newline at end of file
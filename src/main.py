@@ -38,7 +38,7 @@ def check_database_connection():
             logger.error("Database connection failed")
             return False
     except Exception as e:
-        logger.error(f"Database connection error: {e}")
+        logger.error("Database connection error: %s", e)
         return False
 
 def initialize_system():
@@ -52,6 +52,21 @@ def initialize_system():
         print("Run the database_schema.sql script to create the database structure.")
         return False
     
+    # update_grade writes only FinalGrade; grade points and status come from the database
+    try:
+        missing = db_manager.missing_grade_objects()
+    except Exception as e:
+        logger.error("Schema check error: %s", e)
+        print("ERROR: Cannot verify the database schema.")
+        return False
+    if missing:
+        print(f"ERROR: Database is missing: {', '.join(missing)}.")
+        print("Run the database_performance.sql script against the application database.")
+        return False
+    
+    # Open every pooled connection up front so early requests don't pay for it
+    db_manager.prewarm_pool()
+    
     print("System initialized successfully!")
     return True
 
@@ -69,7 +84,7 @@ def main():
     except KeyboardInterrupt:
         print("\n\nApplication terminated by user.")
     except Exception as e:
-        logger.error(f"Unexpected error: {e}")
+        logger.error("Unexpected error: %s", e)
         print(f"An unexpected error occurred: {e}")
         sys.exit(1)
     finally:
@@ -78,7 +93,7 @@ def main():
             db_manager.close_pool()
             logger.info("Database connections closed")
         except Exception as e:
-            logger.warning(f"Error closing database connections: {e}")
+            logger.warning("Error closing database connections: %s", e)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -3,11 +3,17 @@ Data Models Module
 University Course Registration and Grade Management System
 """
 
+import functools
+import sys
 from dataclasses import dataclass, field
 from typing import Optional, List, Dict, Any
 from datetime import datetime, date
 from enum import Enum
 
+# Models are created once per fetched row: on Python 3.10+ they are slotted,
+# so instances carry no per-object __dict__
+_model = dataclass(slots=True) if sys.version_info >= (3, 10) else dataclass
+
 class UserType(Enum):
     STUDENT = "Student"
     INSTRUCTOR = "Instructor"
@@ -41,7 +47,7 @@ class Gender(Enum):
     FEMALE = "F"
     OTHER = "Other"
 
-@dataclass
+@_model
 class User:
     user_id: Optional[int] = None
     username: str = ""
@@ -51,7 +57,7 @@ class User:
     status: UserStatus = UserStatus.PENDING
     last_login_date: Optional[datetime] = None
 
-@dataclass
+@_model
 class Department:
     dept_id: str = ""
     dept_name: str = ""
@@ -59,7 +65,7 @@ class Department:
     created_date: Optional[datetime] = None
     updated_date: Optional[datetime] = None
 
-@dataclass
+@_model
 class Student:
     student_id: str = ""
     user_id: Optional[int] = None
@@ -74,7 +80,7 @@ class Student:
     created_date: Optional[datetime] = None
     updated_date: Optional[datetime] = None
 
-@dataclass
+@_model
 class Instructor:
     instructor_id: str = ""
     user_id: Optional[int] = None
@@ -86,7 +92,7 @@ class Instructor:
     created_date: Optional[datetime] = None
     updated_date: Optional[datetime] = None
 
-@dataclass
+@_model
 class Course:
     course_id: str = ""
     course_name: str = ""
@@ -97,7 +103,7 @@ class Course:
     created_date: Optional[datetime] = None
     updated_date: Optional[datetime] = None
 
-@dataclass
+@_model
 class Section:
     section_id: Optional[int] = None
     course_id: str = ""
@@ -110,7 +116,7 @@ class Section:
     created_date: Optional[datetime] = None
     updated_date: Optional[datetime] = None
 
-@dataclass
+@_model
 class Enrollment:
     enrollment_id: Optional[int] = None
     student_id: str = ""
@@ -121,14 +127,14 @@ class Enrollment:
     grade_points: Optional[float] = None
     updated_date: Optional[datetime] = None
 
-@dataclass
+@_model
 class CoursePrereq:
     course_id: str = ""
     prereq_course_id: str = ""
     min_grade: float = 60.0
     created_date: Optional[datetime] = None
 
-@dataclass
+@_model
 class EnrollmentInfo:
     """Extended enrollment information with related data"""
     enrollment_id: Optional[int] = None
@@ -143,12 +149,12 @@ class EnrollmentInfo:
     time_slot: Optional[str] = None
     location: Optional[str] = None
     instructor_name: Optional[str] = None
-    status: str = ""
+    status: EnrollmentStatus = EnrollmentStatus.ENROLLED
     final_grade: Optional[float] = None
     grade_points: Optional[float] = None
     enrollment_date: Optional[datetime] = None
 
-@dataclass
+@_model
 class SectionInfo:
     """Extended section information with related data"""
     section_id: int = 0
@@ -166,7 +172,7 @@ class SectionInfo:
     instructor_name: Optional[str] = None
     availability_status: str = "Available"
 
-@dataclass
+@_model
 class StudentGPA:
     """Student GPA information"""
     student_id: str = ""
@@ -178,7 +184,7 @@ class StudentGPA:
     total_courses: int = 0
     completed_courses: int = 0
 
-@dataclass
+@_model
 class CourseStatistics:
     """Course statistics information"""
     course_id: str = ""
@@ -194,7 +200,7 @@ class CourseStatistics:
     fail_count: int = 0
     pass_rate: Optional[float] = None
 
-@dataclass
+@_model
 class AuditLog:
     """Audit log entry"""
     log_id: Optional[int] = None
@@ -208,21 +214,19 @@ class AuditLog:
     ip_address: Optional[str] = None
 
 # Utility functions for model conversion
+@functools.lru_cache(maxsize=None)
+def _fields_of(model_class) -> frozenset:
+    """Field names of a dataclass, computed once per class"""
+    return frozenset(model_class.__dataclass_fields__)
+
 def dict_to_model(data_dict: Dict[str, Any], model_class):
     """Convert dictionary to model instance"""
     if not data_dict:
         return None
     
-    # Filter out None values and keys not in model
-    filtered_data = {k: v for k, v in data_dict.items() if v is not None}
-    
-    try:
-        return model_class(**filtered_data)
-    except TypeError as e:
-        # Handle cases where dict keys don't match model fields
-        model_fields = {field.name for field in model_class.__dataclass_fields__.values()}
-        valid_data = {k: v for k, v in filtered_data.items() if k in model_fields}
-        return model_class(**valid_data)
+    # Keep model fields only; None values are dropped so field defaults apply
+    fields = _fields_of(model_class)
+    return model_class(**{k: v for k, v in data_dict.items() if v is not None and k in fields})
 
 def model_to_dict(model_instance) -> Dict[str, Any]:
     """Convert model instance to dictionary"""
@@ -230,7 +234,8 @@ def model_to_dict(model_instance) -> Dict[str, Any]:
         return {}
     
     result = {}
-    for field_name, field_value in model_instance.__dict__.items():
+    for field_name in model_instance.__dataclass_fields__:
+        field_value = getattr(model_instance, field_name)
         if isinstance(field_value, Enum):
             result[field_name] = field_value.value
         elif isinstance(field_value, (datetime, date)):
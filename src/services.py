@@ -6,22 +6,36 @@ University Course Registration and Grade Management System
 from typing import List, Optional, Tuple, Dict, Any
 from datetime import datetime, date
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dao import *
 from models import *
-from config import AppConfig
+from config import AppConfig, DatabaseConfig, RULES
 
 logger = logging.getLogger(__name__)
 
+# Enum members by value for form input; unknown values fall back to the Enum
+# constructor so the error message stays the same
+_SEMESTER = {member.value: member for member in Semester}
+_COURSE_TYPE = {member.value: member for member in CourseType}
+_GENDER = {member.value: member for member in Gender}
+
 class AuthenticationService:
     """Authentication and session management service"""
     
     def __init__(self):
-        self.user_dao = UserDAO()
-        self.student_dao = StudentDAO()
-        self.instructor_dao = InstructorDAO()
+        self.user_dao = get_dao(UserDAO)
+        self.student_dao = get_dao(StudentDAO)
+        self.instructor_dao = get_dao(InstructorDAO)
         self.current_user = None
         self.current_student = None
         self.current_instructor = None
+        # Session-derived values, rebuilt only when the session changes
+        self._current_role = None
+        self._info_cache = None
+        # Profile ids of the logged-in student or instructor, None otherwise
+        self.student_id = None
+        self.instructor_id = None
     
     def login(self, username: str, password: str) -> Tuple[bool, str, Optional[User]]:
         """Authenticate user login"""
@@ -30,19 +44,23 @@ class AuthenticationService:
             
             if user:
                 self.current_user = user
+                self._current_role = user.user_type
+                self._info_cache = None
                 
                 # Load role-specific information
                 if user.user_type == UserType.STUDENT:
                     self.current_student = self.student_dao.get_student_by_user_id(user.user_id)
                 elif user.user_type == UserType.INSTRUCTOR:
                     self.current_instructor = self.instructor_dao.get_instructor_by_user_id(user.user_id)
+                self.student_id = self.current_student.student_id if self.current_student else None
+                self.instructor_id = self.current_instructor.instructor_id if self.current_instructor else None
                 
                 return True, f"Welcome, {username}!", user
             else:
                 return False, "Invalid username or password", None
                 
         except Exception as e:
-            logger.error(f"Login error: {e}")
+            logger.error("Login error: %s", e)
             return False, "Login failed due to system error", None
     
     def logout(self):
@@ -50,6 +68,10 @@ class AuthenticationService:
         self.current_user = None
         self.current_student = None
         self.current_instructor = None
+        self._current_role = None
+        self._info_cache = None
+        self.student_id = None
+        self.instructor_id = None
     
     def is_authenticated(self) -> bool:
         """Check if user is authenticated"""
@@ -57,13 +79,20 @@ class AuthenticationService:
     
     def has_role(self, role: UserType) -> bool:
         """Check if current user has specific role"""
-        return self.current_user and self.current_user.user_type == role
+        return self._current_role is role
+    
+    def current_role(self) -> Optional[UserType]:
+        """Get the current user's role, or None when nobody is logged in"""
+        return self._current_role
     
     def get_current_user_info(self) -> Dict[str, Any]:
         """Get current user information"""
         if not self.current_user:
             return {}
         
+        if self._info_cache is not None:
+            return self._info_cache
+        
         info = {
             'user_id': self.current_user.user_id,
             'username': self.current_user.username,
@@ -86,16 +115,32 @@ class AuthenticationService:
                 'title': self.current_instructor.title
             })
         
+        self._info_cache = info
         return info
 
 class StudentService:
     """Student-related business logic service"""
     
+    # Shared by all instances for running independent reads concurrently; each task
+    # checks out its own pooled connection, so workers never exceed the pool size
+    _EXECUTOR = None
+    _EXECUTOR_LOCK = threading.Lock()
+    
+    @classmethod
+    def _executor(cls) -> ThreadPoolExecutor:
+        """Return the shared executor, creating it on first use"""
+        if cls._EXECUTOR is None:
+            with cls._EXECUTOR_LOCK:
+                if cls._EXECUTOR is None:
+                    cls._EXECUTOR = ThreadPoolExecutor(max_workers=min(4, DatabaseConfig.POOL_SIZE),
+                                                       thread_name_prefix='student-service')
+        return cls._EXECUTOR
+    
     def __init__(self):
-        self.student_dao = StudentDAO()
-        self.enrollment_dao = EnrollmentDAO()
-        self.section_dao = SectionDAO()
-        self.statistics_dao = StatisticsDAO()
+        self.student_dao = get_dao(StudentDAO)
+        self.enrollment_dao = get_dao(EnrollmentDAO)
+        self.section_dao = get_dao(SectionDAO)
+        self.statistics_dao = get_dao(StatisticsDAO)
     
     def register_student(self, student_data: Dict[str, Any], username: str, password: str) -> Tuple[bool, str]:
         """Register a new student"""
@@ -112,7 +157,8 @@ class StudentService:
             student = Student(
                 student_id=student_data['student_id'],
                 name=student_data['name'],
-                gender=Gender(student_data['gender']) if student_data.get('gender') else None,
+                gender=(_GENDER.get(student_data['gender']) or Gender(student_data['gender'])
+                        if student_data.get('gender') else None),
                 birth_date=student_data.get('birth_date'),
                 email=student_data.get('email'),
                 phone=student_data.get('phone'),
@@ -125,7 +171,7 @@ class StudentService:
             return True, f"Student {student_id} registered successfully"
             
         except Exception as e:
-            logger.error(f"Student registration error: {e}")
+            logger.error("Student registration error: %s", e)
             return False, f"Registration failed: {str(e)}"
     
     def get_available_courses(self, student_id: str, semester: str, year: int) -> List[SectionInfo]:
@@ -133,7 +179,7 @@ class StudentService:
         try:
             return self.section_dao.get_available_sections(semester, year, student_id)
         except Exception as e:
-            logger.error(f"Error getting available courses: {e}")
+            logger.error("Error getting available courses: %s", e)
             return []
     
     def enroll_in_course(self, student_id: str, section_id: int) -> Tuple[bool, str]:
@@ -142,7 +188,7 @@ class StudentService:
             success, message = self.enrollment_dao.enroll_student(student_id, section_id)
             return success, message
         except Exception as e:
-            logger.error(f"Enrollment error: {e}")
+            logger.error("Enrollment error: %s", e)
             return False, f"Enrollment failed: {str(e)}"
     
     def drop_course(self, student_id: str, section_id: int) -> Tuple[bool, str]:
@@ -154,7 +200,7 @@ class StudentService:
             else:
                 return False, "Failed to drop course - enrollment not found or already dropped"
         except Exception as e:
-            logger.error(f"Drop course error: {e}")
+            logger.error("Drop course error: %s", e)
             return False, f"Drop failed: {str(e)}"
     
     def get_student_schedule(self, student_id: str, semester: str = None, year: int = None) -> List[EnrollmentInfo]:
@@ -162,21 +208,29 @@ class StudentService:
         try:
             return self.enrollment_dao.get_student_enrollments(student_id, semester, year)
         except Exception as e:
-            logger.error(f"Error getting student schedule: {e}")
+            logger.error("Error getting student schedule: %s", e)
+            return []
+    
+    def get_current_enrollments(self, student_id: str, semester: str, year: int) -> List[EnrollmentInfo]:
+        """Get the courses a student is currently enrolled in for a term"""
+        try:
+            return self.enrollment_dao.get_student_enrollments(student_id, semester, year,
+                                                               status=EnrollmentStatus.ENROLLED)
+        except Exception as e:
+            logger.error("Error getting current enrollments: %s", e)
             return []
     
     def get_student_transcript(self, student_id: str) -> Tuple[List[EnrollmentInfo], StudentGPA]:
         """Get student's complete transcript with GPA"""
         try:
-            # Get all enrollments
-            enrollments = self.enrollment_dao.get_student_enrollments(student_id)
-            
-            # Get GPA information
-            gpa_info = self.statistics_dao.get_student_gpa(student_id)
+            # Enrollments and GPA are independent queries, so fetch them concurrently
+            executor = self._executor()
+            enrollments_future = executor.submit(self.enrollment_dao.get_student_enrollments, student_id)
+            gpa_future = executor.submit(self.statistics_dao.get_student_gpa, student_id)
             
-            return enrollments, gpa_info
+            return enrollments_future.result(), gpa_future.result()
         except Exception as e:
-            logger.error(f"Error getting student transcript: {e}")
+            logger.error("Error getting student transcript: %s", e)
             return [], None
     
     def validate_enrollment_eligibility(self, student_id: str, section_id: int) -> Tuple[bool, List[str]]:
@@ -184,55 +238,46 @@ class StudentService:
         try:
             warnings = []
             
-            # Get section information
-            section = self.section_dao.get_section_by_id(section_id)
-            if not section:
+            # Seat count and the student's same-term enrollments, aggregated in one query
+            probe = self.enrollment_dao.eligibility_probe(student_id, section_id)
+            if not probe:
                 return False, ["Section not found"]
+            available_spots, credits, current_credits, term_enrollments, has_conflict, already_enrolled = probe
             
             # Check capacity
-            if section.available_spots <= 0:
+            if available_spots <= 0:
                 return False, ["Section is full"]
             
-            # Get current semester enrollments
-            current_enrollments = self.enrollment_dao.get_student_enrollments(
-                student_id, section.semester, section.year
-            )
-            
             # Check credit limits
-            current_credits = sum(e.credits for e in current_enrollments if e.status == 'Enrolled')
-            new_total_credits = current_credits + section.credits
+            new_total_credits = current_credits + credits
             
-            if new_total_credits > AppConfig.MAX_CREDITS_PER_SEMESTER:
-                return False, [f"Exceeds maximum credit limit ({AppConfig.MAX_CREDITS_PER_SEMESTER})"]
+            if new_total_credits > RULES.max_credits:
+                return False, [f"Exceeds maximum credit limit ({RULES.max_credits})"]
             
-            if new_total_credits < AppConfig.MIN_CREDITS_PER_SEMESTER and len(current_enrollments) == 0:
-                warnings.append(f"Below minimum credit recommendation ({AppConfig.MIN_CREDITS_PER_SEMESTER})")
+            if new_total_credits < RULES.min_credits and term_enrollments == 0:
+                warnings.append(f"Below minimum credit recommendation ({RULES.min_credits})")
             
             # Check time conflicts
-            for enrollment in current_enrollments:
-                if (enrollment.status == 'Enrolled' and 
-                    enrollment.time_slot and section.time_slot and
-                    enrollment.time_slot == section.time_slot):
-                    return False, ["Time conflict with existing enrollment"]
+            if has_conflict:
+                return False, ["Time conflict with existing enrollment"]
             
             # Check if already enrolled
-            for enrollment in current_enrollments:
-                if enrollment.section_id == section_id:
-                    return False, ["Already enrolled in this section"]
+            if already_enrolled:
+                return False, ["Already enrolled in this section"]
             
             return True, warnings
             
         except Exception as e:
-            logger.error(f"Enrollment validation error: {e}")
+            logger.error("Enrollment validation error: %s", e)
             return False, ["Validation failed due to system error"]
 
 class InstructorService:
     """Instructor-related business logic service"""
     
     def __init__(self):
-        self.instructor_dao = InstructorDAO()
-        self.enrollment_dao = EnrollmentDAO()
-        self.section_dao = SectionDAO()
+        self.instructor_dao = get_dao(InstructorDAO)
+        self.enrollment_dao = get_dao(EnrollmentDAO)
+        self.section_dao = get_dao(SectionDAO)
     
     def register_instructor(self, instructor_data: Dict[str, Any], username: str, password: str) -> Tuple[bool, str]:
         """Register a new instructor"""
@@ -259,7 +304,7 @@ class InstructorService:
             return True, f"Instructor {instructor_id} registered successfully"
             
         except Exception as e:
-            logger.error(f"Instructor registration error: {e}")
+            logger.error("Instructor registration error: %s", e)
             return False, f"Registration failed: {str(e)}"
     
     def get_instructor_sections(self, instructor_id: str, semester: str = None, year: int = None) -> List[SectionInfo]:
@@ -269,7 +314,7 @@ class InstructorService:
             # For now, return empty list - would need to implement in SectionDAO
             return []
         except Exception as e:
-            logger.error(f"Error getting instructor sections: {e}")
+            logger.error("Error getting instructor sections: %s", e)
             return []
     
     def get_section_roster(self, section_id: int) -> List[EnrollmentInfo]:
@@ -277,7 +322,15 @@ class InstructorService:
         try:
             return self.enrollment_dao.get_section_enrollments(section_id)
         except Exception as e:
-            logger.error(f"Error getting section roster: {e}")
+            logger.error("Error getting section roster: %s", e)
+            return []
+    
+    def get_gradable_roster(self, section_id: int) -> List[EnrollmentInfo]:
+        """Get the enrolled and completed students of a section"""
+        try:
+            return self.enrollment_dao.get_gradable_enrollments(section_id)
+        except Exception as e:
+            logger.error("Error getting gradable roster: %s", e)
             return []
     
     def update_student_grade(self, enrollment_id: int, final_grade: float) -> Tuple[bool, str]:
@@ -294,16 +347,16 @@ class InstructorService:
                 return False, "Failed to update grade - enrollment not found"
                 
         except Exception as e:
-            logger.error(f"Grade update error: {e}")
+            logger.error("Grade update error: %s", e)
             return False, f"Grade update failed: {str(e)}"
 
 class CourseService:
     """Course management service"""
     
     def __init__(self):
-        self.course_dao = CourseDAO()
-        self.section_dao = SectionDAO()
-        self.statistics_dao = StatisticsDAO()
+        self.course_dao = get_dao(CourseDAO)
+        self.section_dao = get_dao(SectionDAO)
+        self.statistics_dao = get_dao(StatisticsDAO)
     
     def create_course(self, course_data: Dict[str, Any]) -> Tuple[bool, str]:
         """Create a new course"""
@@ -313,7 +366,7 @@ class CourseService:
                 course_name=course_data['course_name'],
                 credits=float(course_data['credits']),
                 department=course_data.get('department'),
-                course_type=CourseType(course_data['course_type']),
+                course_type=_COURSE_TYPE.get(course_data['course_type']) or CourseType(course_data['course_type']),
                 description=course_data.get('description')
             )
             
@@ -321,7 +374,7 @@ class CourseService:
             return True, f"Course {course_id} created successfully"
             
         except Exception as e:
-            logger.error(f"Course creation error: {e}")
+            logger.error("Course creation error: %s", e)
             return False, f"Course creation failed: {str(e)}"
     
     def search_courses(self, search_term: str = None, department: str = None) -> List[Course]:
@@ -332,7 +385,15 @@ class CourseService:
             else:
                 return self.course_dao.get_all_courses(department)
         except Exception as e:
-            logger.error(f"Course search error: {e}")
+            logger.error("Course search error: %s", e)
+            return []
+    
+    def list_course_ids_and_names(self) -> List[Tuple[str, str]]:
+        """Get (course_id, course_name) pairs for every course"""
+        try:
+            return self.course_dao.get_course_names()
+        except Exception as e:
+            logger.error("Error listing courses: %s", e)
             return []
     
     def create_section(self, section_data: Dict[str, Any]) -> Tuple[bool, str]:
@@ -341,7 +402,7 @@ class CourseService:
             section = Section(
                 course_id=section_data['course_id'],
                 instructor_id=section_data.get('instructor_id'),
-                semester=Semester(section_data['semester']),
+                semester=_SEMESTER.get(section_data['semester']) or Semester(section_data['semester']),
                 year=int(section_data['year']),
                 max_capacity=int(section_data['max_capacity']),
                 time_slot=section_data.get('time_slot'),
@@ -352,7 +413,7 @@ class CourseService:
             return True, f"Section {section_id} created successfully"
             
         except Exception as e:
-            logger.error(f"Section creation error: {e}")
+            logger.error("Section creation error: %s", e)
             return False, f"Section creation failed: {str(e)}"
     
     def get_course_statistics(self) -> List[CourseStatistics]:
@@ -360,18 +421,18 @@ class CourseService:
         try:
             return self.statistics_dao.get_course_statistics()
         except Exception as e:
-            logger.error(f"Error getting course statistics: {e}")
+            logger.error("Error getting course statistics: %s", e)
             return []
 
 class AdminService:
     """Administrative service"""
     
     def __init__(self):
-        self.department_dao = DepartmentDAO()
-        self.student_dao = StudentDAO()
-        self.instructor_dao = InstructorDAO()
-        self.course_dao = CourseDAO()
-        self.statistics_dao = StatisticsDAO()
+        self.department_dao = get_dao(DepartmentDAO)
+        self.student_dao = get_dao(StudentDAO)
+        self.instructor_dao = get_dao(InstructorDAO)
+        self.course_dao = get_dao(CourseDAO)
+        self.statistics_dao = get_dao(StatisticsDAO)
     
     def create_department(self, dept_data: Dict[str, Any]) -> Tuple[bool, str]:
         """Create a new department"""
@@ -386,7 +447,7 @@ class AdminService:
             return True, f"Department {dept_id} created successfully"
             
         except Exception as e:
-            logger.error(f"Department creation error: {e}")
+            logger.error("Department creation error: %s", e)
             return False, f"Department creation failed: {str(e)}"
     
     def get_all_departments(self) -> List[Department]:
@@ -394,15 +455,16 @@ class AdminService:
         try:
             return self.department_dao.get_all_departments()
         except Exception as e:
-            logger.error(f"Error getting departments: {e}")
+            logger.error("Error getting departments: %s", e)
             return []
     
-    def get_all_students(self, limit: int = 100, offset: int = 0) -> List[Student]:
-        """Get all students with pagination"""
+    def get_all_students(self, limit: int = 100, offset: int = 0,
+                         after_id: Optional[str] = None) -> List[Student]:
+        """Get all students with pagination (keyset when after_id is given)"""
         try:
-            return self.student_dao.get_all_students(limit, offset)
+            return self.student_dao.get_all_students(limit, offset, after_id)
         except Exception as e:
-            logger.error(f"Error getting students: {e}")
+            logger.error("Error getting students: %s", e)
             return []
     
     def get_all_instructors(self) -> List[Instructor]:
@@ -410,37 +472,32 @@ class AdminService:
         try:
             return self.instructor_dao.get_all_instructors()
         except Exception as e:
-            logger.error(f"Error getting instructors: {e}")
+            logger.error("Error getting instructors: %s", e)
             return []
     
     def get_system_statistics(self) -> Dict[str, Any]:
         """Get system-wide statistics"""
         try:
-            stats = {}
-            
-            # Get basic counts
-            students = self.get_all_students(limit=1000)  # Get more for accurate count
-            instructors = self.get_all_instructors()
-            departments = self.get_all_departments()
-            
-            stats['total_students'] = len(students)
-            stats['total_instructors'] = len(instructors)
-            stats['total_departments'] = len(departments)
-            
-            # Get course statistics
-            course_stats = self.statistics_dao.get_course_statistics()
-            stats['total_courses'] = len(course_stats)
-            stats['total_enrollments'] = sum(cs.total_enrollments for cs in course_stats)
-            
-            return stats
+            # Counts only; computed by the database instead of fetching and measuring lists
+            return dict(self.statistics_dao.get_system_counts())
             
         except Exception as e:
-            logger.error(f"Error getting system statistics: {e}")
+            logger.error("Error getting system statistics: %s", e)
             return {}
 
-# Global service instances
-auth_service = AuthenticationService()
-student_service = StudentService()
-instructor_service = InstructorService()
-course_service = CourseService()
-admin_service = AdminService()
\ No newline at end of file
+# Global service instances, created on first access (PEP 562) so importing this
+# module constructs no services or DAOs
+_SERVICE_CLASSES = {
+    'auth_service': AuthenticationService,
+    'student_service': StudentService,
+    'instructor_service': InstructorService,
+    'course_service': CourseService,
+    'admin_service': AdminService,
+}
+
+def __getattr__(name):
+    """Create a global service instance the first time it is accessed"""
+    service_class = _SERVICE_CLASSES.get(name)
+    if service_class is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return globals().setdefault(name, service_class())
@@ -7,9 +7,14 @@ University Course Registration and Grade Management System
 import mysql.connector
 from mysql.connector import Error
 import os
+import re
 import sys
 from pathlib import Path
 
+# Directory of this script and the project root holding the SQL files
+_HERE = Path(__file__).resolve().parent
+_ROOT = _HERE.parent
+
 def read_sql_file(file_path):
     """Read SQL file and return its content"""
     try:
@@ -22,13 +27,56 @@ def read_sql_file(file_path):
         print(f"Error reading SQL file: {e}")
         return None
 
+# Simple statements sent per multi-statement round trip by execute_sql_script
+SCRIPT_BATCH_SIZE = 100
+
+# Maximum INSERT ... VALUES statements folded into one multi-row INSERT
+INSERT_FOLD_LIMIT = 700
+_INSERT_VALUES = re.compile(r'INSERT\s+INTO\s+(`?\w+`?)\s*(\([^)]*\))\s*VALUES\s*(\(.*\))$',
+                            re.IGNORECASE | re.DOTALL)
+
+def _fold_inserts(statements):
+    """Merge runs of INSERT ... VALUES statements into the same table and columns
+    
+    Returns the folded statements and, for each one, the original statements it replaces.
+    """
+    folded = []
+    sources = []
+    target = None
+    for statement in statements:
+        match = _INSERT_VALUES.match(statement)
+        if match and 'ON DUPLICATE KEY' in statement.upper():
+            match = None
+        key = (match.group(1).lower(), ' '.join(match.group(2).split())) if match else None
+        if key is not None and key == target and len(sources[-1]) < INSERT_FOLD_LIMIT:
+            folded[-1] += ",\n" + match.group(3)
+            sources[-1].append(statement)
+        else:
+            folded.append(statement)
+            sources.append([statement])
+            target = key
+    return folded, sources
+
+def _execute_batch(cursor, batch):
+    """Send several statements in one round trip; returns how many completed before an error"""
+    completed = 0
+    try:
+        for result in cursor.execute(';\n'.join(batch), multi=True):
+            if result.with_rows:
+                result.fetchall()
+            completed += 1
+    except Error as e:
+        return completed, e
+    return completed, None
+
 def execute_sql_script(cursor, sql_script):
     """Execute SQL script with multiple statements"""
     try:
-        # Split the script into individual statements
+        # Split the script into individual statements, honouring DELIMITER changes
+        # so trigger/procedure bodies containing ';' stay in one statement
         statements = []
         current_statement = ""
-        in_delimiter = False
+        delimiter = ';'
         
         for line in sql_script.split('\n'):
             line = line.strip()
@@ -38,41 +86,56 @@ def execute_sql_script(cursor, sql_script):
                 continue
             
             # Handle DELIMITER changes
-            if line.startswith('DELIMITER'):
-                in_delimiter = True
+            if line.upper().startswith('DELIMITER'):
+                parts = line.split()
+                delimiter = parts[1] if len(parts) > 1 else ';'
                 continue
-            elif line == '//':
-                if in_delimiter:
-                    statements.append(current_statement.strip())
-                    current_statement = ""
-                    in_delimiter = False
-                continue
-            
-            current_statement += line + "\n"
             
-            # If not in delimiter block and line ends with semicolon, it's end of statement
-            if not in_delimiter and line.endswith(';'):
+            # A statement ends when a line ends with the current delimiter
+            if line.endswith(delimiter):
+                current_statement += line[:-len(delimiter)] + "\n"
                 statements.append(current_statement.strip())
                 current_statement = ""
+            else:
+                current_statement += line + "\n"
         
         # Add any remaining statement
         if current_statement.strip():
             statements.append(current_statement.strip())
         
-        # Execute each statement
-        for i, statement in enumerate(statements):
-            if statement:
-                try:
-                    # Handle multi-statement execution for procedures/triggers
-                    if 'CREATE TRIGGER' in statement or 'CREATE PROCEDURE' in statement:
-                        cursor.execute(statement, multi=True)
-                    else:
-                        cursor.execute(statement)
-                    print(f"Executed statement {i+1}/{len(statements)}")
-                except Error as e:
-                    print(f"Error executing statement {i+1}: {e}")
-                    print(f"Statement: {statement[:100]}...")
-                    # Continue with other statements
+        statements, sources = _fold_inserts(statements)
+        
+        # Consecutive simple statements go to the server in batches; trigger and procedure
+        # bodies (BEGIN ... END) are sent on their own
+        total = len(statements)
+        i = 0
+        while i < total:
+            batch = []
+            while (i + len(batch) < total and len(batch) < SCRIPT_BATCH_SIZE
+                   and 'BEGIN' not in statements[i + len(batch)].upper()):
+                batch.append(statements[i + len(batch)])
+            if not batch:
+                batch = [statements[i]]
+            
+            completed, error = _execute_batch(cursor, batch)
+            if completed:
+                print(f"Executed statements {i+1}-{i+completed}/{total}")
+            i += completed
+            if error is not None:
+                if len(sources[i]) > 1:
+                    # A failed multi-row INSERT inserts nothing; retry its rows one at a time
+                    # so only the bad rows are lost
+                    print(f"Folded INSERT {i+1} failed ({error}); retrying its {len(sources[i])} rows one by one")
+                    for statement in sources[i]:
+                        _, row_error = _execute_batch(cursor, [statement])
+                        if row_error is not None:
+                            print(f"Error executing statement: {row_error}")
+                            print(f"Statement: {statement[:100]}...")
+                else:
+                    print(f"Error executing statement {i+1}: {error}")
+                    print(f"Statement: {statements[i][:100]}...")
+                # Continue with the statements after the failed one
+                i += 1
         
         return True
         
@@ -104,7 +167,7 @@ def setup_database():
         print("Connected to MySQL server successfully!")
         
         # Read and execute the schema file
-        schema_file = Path(__file__).parent.parent / 'database_schema.sql'
+        schema_file = _ROOT / 'database_schema.sql'
         print(f"Reading schema file: {schema_file}")
         
         sql_script = read_sql_file(schema_file)
@@ -119,6 +182,7 @@ def setup_database():
         if success:
             connection.commit()
             print("Database schema created successfully!")
+            print("Apply database_performance.sql to the application database as a separate step (see README).")
             
             # Test the application user connection
             print("Testing application user connection...")
@@ -162,7 +226,7 @@ def install_dependencies():
         import sys
         
         # Read requirements file
-        requirements_file = Path(__file__).parent / 'requirements.txt'
+        requirements_file = _HERE / 'requirements.txt'
         
         if requirements_file.exists():
             result = subprocess.run([
@@ -185,8 +249,8 @@ def install_dependencies():
 
 def create_env_file():
     """Create .env file from example"""
-    env_file = Path(__file__).parent / '.env'
-    env_example = Path(__file__).parent / '.env.example'
+    env_file = _HERE / '.env'
+    env_example = _HERE / '.env.example'
     
     if not env_file.exists() and env_example.exists():
         try:
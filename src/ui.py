@@ -4,18 +4,103 @@ University Course Registration and Grade Management System
 Command Line Interface
 """
 
-import os
 import sys
-from typing import List, Dict, Any, Optional
-from datetime import datetime, date
-from tabulate import tabulate
-from colorama import init, Fore, Back, Style
+import time
+from collections import defaultdict
+from functools import lru_cache
+from itertools import chain, islice
+from operator import attrgetter, itemgetter
+from unicodedata import east_asian_width
+from typing import List, Dict, Any, Iterable, Optional, Tuple, Union
+from datetime import date
+from colorama import init, Fore, Style
 import logging
 
+import services
 from services import *
+from dao import identity_scope
 from models import *
 from config import AppConfig
 
+# Chronological position of each term within a year (Spring, Summer, Fall)
+_SEMESTER_ORDER = {semester.value: index for index, semester in enumerate(Semester)}
+
+# Term for each calendar month: January-May Spring, June-August Summer, September-December Fall
+_SEMESTER_BY_MONTH = ("Spring",) * 5 + ("Summer",) * 3 + ("Fall",) * 4
+
+def current_semester() -> Tuple[str, int]:
+    """Return the (semester, year) of today's date"""
+    today = date.today()
+    return _SEMESTER_BY_MONTH[today.month - 1], today.year
+
+def read_line(prompt: str = "") -> str:
+    """Prompt for and read one line of input
+    
+    Interactive terminals go through input() to keep line editing; piped or scripted
+    input is read straight from the buffered sys.stdin, skipping the readline machinery.
+    """
+    if sys.stdin.isatty():
+        return input(prompt)
+    sys.stdout.write(prompt)
+    sys.stdout.flush()
+    line = sys.stdin.readline()
+    if not line:
+        raise EOFError
+    return line.rstrip('\r\n')
+
+def _display_width(text: str) -> int:
+    """Terminal columns taken by text; wide (e.g. CJK) characters take two"""
+    if text.isascii():
+        return len(text)
+    return sum(2 if east_asian_width(char) in 'WF' else 1 for char in text)
+
+@lru_cache(maxsize=64)
+def _column_spec(headers: Tuple[Any, ...]) -> Tuple[Tuple[str, ...], Tuple[int, ...]]:
+    """Header strings and their display widths, worked out once per distinct header row"""
+    labels = tuple(str(header) for header in headers)
+    return labels, tuple(_display_width(label) for label in labels)
+
+def _truncate(text: Optional[str], limit: int = 50) -> str:
+    """Shorten text to limit characters plus '...', or '' for None"""
+    if not text:
+        return ''
+    return text[:limit] + '...' if len(text) > limit else text
+
+# Marks the end of the rows fed to display_paged_table
+_END = object()
+
+# Fixed picker options, built once
+_SEMESTERS = tuple(semester.value for semester in Semester)
+_COURSE_TYPES = tuple(course_type.value for course_type in CourseType)
+_GENDER_MAP = {"Male": "M", "Female": "F", "Other": "Other"}
+_GENDER_CHOICES = tuple(_GENDER_MAP)
+
+# Screen header: the title between two cyan 80-column bars
+_HEADER_BAR = '=' * 80
+_HEADER_TEMPLATE = f"\n{Fore.CYAN}{_HEADER_BAR}\n{Fore.CYAN}{{title}}\n{Fore.CYAN}{_HEADER_BAR}\n\n"
+# Same header drawn over the current screen: cursor home, erase the rest of each header
+# line, then erase everything below
+_REDRAW_TEMPLATE = "\x1b[H" + _HEADER_TEMPLATE.replace("\n", "\x1b[K\n") + "\x1b[J"
+
+# Column order of the rows view_transcript builds for each term
+_TRANSCRIPT_HEADERS = ("Course ID", "Course Name", "Credits", "Grade", "Points", "Status")
+
+# Admin list columns, with one C-level getter per model pulling every displayed field at once
+_STUDENT_HEADERS = ("Student ID", "Name", "Gender", "Email", "College", "Major", "Enrollment Year")
+_student_fields = attrgetter('student_id', 'name', 'gender', 'email', 'college', 'major', 'enrollment_year')
+_INSTRUCTOR_HEADERS = ("Instructor ID", "Name", "Department", "Title", "Email", "Phone")
+_instructor_fields = attrgetter('instructor_id', 'name', 'department', 'title', 'email', 'phone')
+_COURSE_HEADERS = ("Course ID", "Course Name", "Credits", "Department", "Type", "Description")
+_course_fields = attrgetter('course_id', 'course_name', 'credits', 'department', 'course_type', 'description')
+
+# Table cell rendering by exact value type: blank for None, two decimals for floats,
+# str() for everything else
+_CELL_FORMATTERS = {
+    float: "{:.2f}".format,
+    type(None): lambda value: '',
+    str: str,
+}
+
 # Initialize colorama for cross-platform colored output
 init(autoreset=True)
 
@@ -28,16 +113,47 @@ class UIManager:
     def __init__(self):
         self.running = True
         self.current_menu = None
+        # (version, expiry, departments, menu labels) for the department pickers; bumping
+        # _dept_version after a department change makes the next picker reload
+        self._dept_cache = None
+        self._dept_version = 0
+    
+    def get_department_choices(self, ttl: float = 60) -> Tuple[List[Department], List[str]]:
+        """Get departments and their "ID - Name" menu labels, reused for ttl seconds"""
+        cache = self._dept_cache
+        if cache is None or cache[0] != self._dept_version or cache[1] < time.monotonic():
+            departments = services.admin_service.get_all_departments()
+            choices = [f"{d.dept_id} - {d.dept_name}" for d in departments]
+            cache = (self._dept_version, time.monotonic() + ttl, departments, choices)
+            self._dept_cache = cache
+        return cache[2], cache[3]
+    
+    def invalidate_departments(self):
+        """Force the next department picker to reload the list"""
+        self._dept_version += 1
     
     def clear_screen(self):
         """Clear the console screen"""
-        os.system('cls' if os.name == 'nt' else 'clear')
+        # ANSI home + clear screen + clear scrollback instead of spawning cls/clear;
+        # colorama's init() translates these for the Windows console
+        sys.stdout.write("\x1b[H\x1b[2J\x1b[3J")
+        sys.stdout.flush()
+    
+    def redraw(self, title: str):
+        """Replace the screen below the header in place, rewriting only the header lines
+        
+        Used between menu screens: the cursor goes home and each header line is
+        overwritten and cleared to its end, then everything below is cleared, all in
+        one write. The full clear_screen is kept for login and logout.
+        """
+        sys.stdout.write(_REDRAW_TEMPLATE.format(title=title.center(80)))
+        sys.stdout.flush()
     
     def print_header(self, title: str):
         """Print a formatted header"""
-        print(f"\n{Fore.CYAN}{'=' * 80}")
-        print(f"{Fore.CYAN}{title.center(80)}")
-        print(f"{Fore.CYAN}{'=' * 80}\n")
+        # One write instead of three print() calls
+        sys.stdout.write(_HEADER_TEMPLATE.format(title=title.center(80)))
+        sys.stdout.flush()
     
     def print_success(self, message: str):
         """Print success message"""
@@ -59,7 +175,7 @@ class UIManager:
         """Get user input with validation"""
         while True:
             try:
-                value = input(f"{Fore.WHITE}{prompt}: ").strip()
+                value = read_line(f"{Fore.WHITE}{prompt}: ").strip()
                 
                 if not value and required:
                     self.print_error("This field is required")
@@ -73,7 +189,7 @@ class UIManager:
                 elif input_type == float:
                     return float(value)
                 elif input_type == date:
-                    return datetime.strptime(value, "%Y-%m-%d").date()
+                    return date.fromisoformat(value)
                 else:
                     return value
                     
@@ -84,28 +200,31 @@ class UIManager:
                 print("\nOperation cancelled")
                 return None
     
-    def get_choice(self, prompt: str, choices: List[str], allow_cancel: bool = True) -> Optional[str]:
-        """Get user choice from a list of options"""
-        print(f"\n{prompt}")
+    def get_choice(self, prompt: str, choices: Iterable[str], allow_cancel: bool = True) -> Optional[str]:
+        """Get user choice from a list of options (any iterable, walked once)"""
+        lines = [f"\n{prompt}"]
+        # Entered text maps straight to the selected option; built in the same pass as the menu
+        choice_map = {}
         for i, choice in enumerate(choices, 1):
-            print(f"{i}. {choice}")
-        
+            key = str(i)
+            lines.append(f"{key}. {choice}")
+            choice_map[key] = choice
         if allow_cancel:
-            print("0. Cancel")
+            lines.append("0. Cancel")
+            choice_map['0'] = None
+        print("\n".join(lines))
         
         while True:
             try:
-                choice_num = int(input("\nEnter your choice: "))
+                entry = read_line("\nEnter your choice: ").strip()
                 
-                if choice_num == 0 and allow_cancel:
-                    return None
-                elif 1 <= choice_num <= len(choices):
-                    return choices[choice_num - 1]
-                else:
+                if entry in choice_map:
+                    return choice_map[entry]
+                elif entry.isdigit():
                     self.print_error("Invalid choice")
+                else:
+                    self.print_error("Please enter a number")
                     
-            except ValueError:
-                self.print_error("Please enter a number")
             except KeyboardInterrupt:
                 print("\nOperation cancelled")
                 return None
@@ -113,7 +232,7 @@ class UIManager:
     def confirm_action(self, message: str) -> bool:
         """Get user confirmation"""
         while True:
-            response = input(f"{message} (y/n): ").strip().lower()
+            response = read_line(f"{message} (y/n): ").strip().lower()
             if response in ['y', 'yes']:
                 return True
             elif response in ['n', 'no']:
@@ -121,37 +240,118 @@ class UIManager:
             else:
                 self.print_error("Please enter 'y' or 'n'")
     
-    def display_table(self, data: List[Dict[str, Any]], headers: List[str] = None, title: str = None):
-        """Display data in a formatted table"""
-        if not data:
+    def display_table(self, data: Iterable[Union[Dict[str, Any], tuple]], headers: List[str] = None,
+                      title: str = None):
+        """Display data in a formatted table
+        
+        Rows are dicts keyed by header, or tuples already in headers order (headers required).
+        data may be any iterable, including a generator; it is consumed once, row by row.
+        """
+        rows = iter(data)
+        first = next(rows, _END)
+        if first is _END:
             self.print_info("No data to display")
             return
         
+        # Title and table go out in a single write
+        parts = []
         if title:
-            print(f"\n{Fore.CYAN}{title}")
-            print(f"{Fore.CYAN}{'-' * len(title)}")
+            parts.append(f"\n{Fore.CYAN}{title}\n{Fore.CYAN}{'-' * len(title)}{Style.RESET_ALL}\n")
         
         if headers is None:
-            headers = list(data[0].keys())
+            headers = list(first.keys())
         
-        # Prepare table data
-        table_data = []
-        for row in data:
-            table_row = []
-            for header in headers:
-                value = row.get(header, '')
-                if value is None:
-                    value = ''
-                elif isinstance(value, float):
-                    value = f"{value:.2f}"
-                table_row.append(str(value))
-            table_data.append(table_row)
-        
-        print(tabulate(table_data, headers=headers, tablefmt="grid"))
+        # Dict rows normally share one set of keys, so each row's cells are pulled with a
+        # single itemgetter call and only ragged rows fall back to .get()
+        if isinstance(first, dict):
+            getter = itemgetter(*headers)
+            single = len(headers) == 1
+            
+            def cells(row):
+                try:
+                    values = getter(row)
+                except KeyError:
+                    return [row.get(header, '') for header in headers]
+                return (values,) if single else values
+        else:
+            cells = tuple
+        
+        # Only the formatted cells are kept (column widths need every row); source rows are
+        # formatted as they are pulled and never collected
+        table_data = [[_CELL_FORMATTERS.get(type(value), str)(value) for value in cells(row)]
+                      for row in chain((first,), rows)]
+        
+        parts.append(self._render_grid(table_data, headers))
+        parts.append("\n")
+        sys.stdout.write("".join(parts))
+        sys.stdout.flush()
+    
+    def _render_grid(self, rows: List[List[str]], headers: List[str]) -> str:
+        """Render string cells as a grid table (the layout of tabulate's "grid" format)"""
+        # Views reuse a handful of fixed header rows, so their layout comes from a cache
+        headers, header_widths = _column_spec(tuple(headers))
+        widths = list(header_widths)
+        # One scan over the rows measures every cell and widens the columns as it goes
+        row_widths = []
+        for row in rows:
+            cell_widths = [_display_width(cell) for cell in row]
+            row_widths.append(cell_widths)
+            for i, width in enumerate(cell_widths):
+                if width > widths[i]:
+                    widths[i] = width
+        
+        rule = "+" + "+".join("-" * (width + 2) for width in widths) + "+"
+        
+        def render_row(cells, cell_widths):
+            return "| " + " | ".join(cell + " " * (width - cell_width)
+                                     for cell, cell_width, width in zip(cells, cell_widths, widths)) + " |"
+        
+        lines = [rule, render_row(headers, header_widths),
+                 rule.replace("-", "=")]
+        for row, cell_widths in zip(rows, row_widths):
+            lines.append(render_row(row, cell_widths))
+            lines.append(rule)
+        return "\n".join(lines)
+    
+    def display_paged_table(self, rows: Iterable[Dict[str, Any]], headers: List[str] = None,
+                            title: str = None, page_size: int = None):
+        """Display rows a page at a time; rows are pulled and formatted only as pages are shown"""
+        page_size = page_size or AppConfig.ITEMS_PER_PAGE
+        rows = iter(rows)
+        # One row of lookahead tells whether another page exists
+        lookahead = next(rows, _END)
+        if lookahead is _END:
+            self.print_info("No data to display")
+            return
+        
+        pages = []
+        page_index = 0
+        while True:
+            if page_index == len(pages):
+                pages.append([lookahead, *islice(rows, page_size - 1)])
+                lookahead = next(rows, _END)
+            has_prev = page_index > 0
+            has_next = page_index < len(pages) - 1 or lookahead is not _END
+            
+            page_title = title
+            if has_prev or has_next:
+                page_title = f"{title or 'Results'} (page {page_index + 1})"
+            self.display_table(pages[page_index], headers, page_title)
+            if not (has_prev or has_next):
+                return
+            
+            options = (["(n)ext"] if has_next else []) + (["(p)rev"] if has_prev else []) + ["(q)uit"]
+            action = read_line(f"\n{', '.join(options)}: ").strip().lower()[:1]
+            if action == 'n' and has_next:
+                page_index += 1
+            elif action == 'p' and has_prev:
+                page_index -= 1
+            elif action == 'q':
+                return
     
     def wait_for_key(self, message: str = "Press Enter to continue..."):
         """Wait for user to press a key"""
-        input(f"\n{message}")
+        read_line(f"\n{message}")
     
     def run(self):
         """Main application loop"""
@@ -160,10 +360,12 @@ class UIManager:
         
         while self.running:
             try:
-                if not auth_service.is_authenticated():
-                    self.show_login_menu()
-                else:
-                    self.show_main_menu()
+                # Each menu action is one unit of work for the DAO identity map
+                with identity_scope():
+                    if not services.auth_service.is_authenticated():
+                        self.show_login_menu()
+                    else:
+                        self.show_main_menu()
             except KeyboardInterrupt:
                 print("\n\nGoodbye!")
                 self.running = False
@@ -174,6 +376,15 @@ class UIManager:
 class LoginMenu:
     """Login and registration menu"""
     
+    # Main options in display order, mapped to the method handling each
+    _DISPATCH = {
+        "Login": "login",
+        "Register as Student": "register_student",
+        "Register as Instructor": "register_instructor",
+        "Exit": "exit",
+    }
+    _CHOICES = tuple(_DISPATCH)
+    
     def __init__(self, ui: UIManager):
         self.ui = ui
     
@@ -182,23 +393,14 @@ class LoginMenu:
         self.ui.clear_screen()
         self.ui.print_header("Login / Registration")
         
-        choices = [
-            "Login",
-            "Register as Student",
-            "Register as Instructor",
-            "Exit"
-        ]
+        choice = self.ui.get_choice("Please select an option:", self._CHOICES, allow_cancel=False)
         
-        choice = self.ui.get_choice("Please select an option:", choices, allow_cancel=False)
-        
-        if choice == "Login":
-            self.login()
-        elif choice == "Register as Student":
-            self.register_student()
-        elif choice == "Register as Instructor":
-            self.register_instructor()
-        elif choice == "Exit":
-            self.ui.running = False
+        if choice:
+            getattr(self, self._DISPATCH[choice])()
+    
+    def exit(self):
+        """Stop the application loop"""
+        self.ui.running = False
     
     def login(self):
         """Handle user login"""
@@ -213,7 +415,7 @@ class LoginMenu:
         if not password:
             return
         
-        success, message, user = auth_service.login(username, password)
+        success, message, user = services.auth_service.login(username, password)
         
         if success:
             self.ui.print_success(message)
@@ -240,21 +442,16 @@ class LoginMenu:
         student_id = self.ui.get_input("Student ID")
         name = self.ui.get_input("Full Name")
         
-        gender_choices = ["Male", "Female", "Other"]
-        gender_choice = self.ui.get_choice("Gender", gender_choices)
-        gender = None
-        if gender_choice:
-            gender_map = {"Male": "M", "Female": "F", "Other": "Other"}
-            gender = gender_map[gender_choice]
+        gender_choice = self.ui.get_choice("Gender", _GENDER_CHOICES)
+        gender = _GENDER_MAP[gender_choice] if gender_choice else None
         
         birth_date = self.ui.get_input("Birth Date (YYYY-MM-DD)", date, required=False)
         email = self.ui.get_input("Email", required=False)
         phone = self.ui.get_input("Phone", required=False)
         
         # Get departments for college selection
-        departments = admin_service.get_all_departments()
+        departments, dept_choices = self.ui.get_department_choices()
         if departments:
-            dept_choices = [f"{d.dept_id} - {d.dept_name}" for d in departments]
             college_choice = self.ui.get_choice("College", dept_choices)
             college = college_choice.split(" - ")[0] if college_choice else None
         else:
@@ -276,7 +473,7 @@ class LoginMenu:
             'enrollment_year': enrollment_year
         }
         
-        success, message = student_service.register_student(student_data, username, password)
+        success, message = services.student_service.register_student(student_data, username, password)
         
         if success:
             self.ui.print_success(message)
@@ -304,9 +501,8 @@ class LoginMenu:
         name = self.ui.get_input("Full Name")
         
         # Get departments
-        departments = admin_service.get_all_departments()
+        departments, dept_choices = self.ui.get_department_choices()
         if departments:
-            dept_choices = [f"{d.dept_id} - {d.dept_name}" for d in departments]
             dept_choice = self.ui.get_choice("Department", dept_choices)
             department = dept_choice.split(" - ")[0] if dept_choice else None
         else:
@@ -326,7 +522,7 @@ class LoginMenu:
             'title': title
         }
         
-        success, message = instructor_service.register_instructor(instructor_data, username, password)
+        success, message = services.instructor_service.register_instructor(instructor_data, username, password)
         
         if success:
             self.ui.print_success(message)
@@ -338,70 +534,59 @@ class LoginMenu:
 class StudentMenu:
     """Student-specific menu"""
     
+    # Main options in display order, mapped to the method handling each
+    _DISPATCH = {
+        "View Available Courses": "view_available_courses",
+        "Enroll in Course": "enroll_in_course",
+        "View My Schedule": "view_schedule",
+        "Drop Course": "drop_course",
+        "View Transcript": "view_transcript",
+        "View GPA": "view_gpa",
+        "Logout": "logout",
+    }
+    _CHOICES = tuple(_DISPATCH)
+    
     def __init__(self, ui: UIManager):
         self.ui = ui
     
     def show(self):
         """Show student menu"""
-        self.ui.clear_screen()
-        user_info = auth_service.get_current_user_info()
-        self.ui.print_header(f"Student Portal - {user_info.get('name', 'Student')}")
-        
-        choices = [
-            "View Available Courses",
-            "Enroll in Course",
-            "View My Schedule",
-            "Drop Course",
-            "View Transcript",
-            "View GPA",
-            "Logout"
-        ]
-        
-        choice = self.ui.get_choice("Please select an option:", choices, allow_cancel=False)
-        
-        if choice == "View Available Courses":
-            self.view_available_courses()
-        elif choice == "Enroll in Course":
-            self.enroll_in_course()
-        elif choice == "View My Schedule":
-            self.view_schedule()
-        elif choice == "Drop Course":
-            self.drop_course()
-        elif choice == "View Transcript":
-            self.view_transcript()
-        elif choice == "View GPA":
-            self.view_gpa()
-        elif choice == "Logout":
-            auth_service.logout()
+        user_info = services.auth_service.get_current_user_info()
+        self.ui.redraw(f"Student Portal - {user_info.get('name', 'Student')}")
+        
+        choice = self.ui.get_choice("Please select an option:", self._CHOICES, allow_cancel=False)
+        
+        if choice:
+            getattr(self, self._DISPATCH[choice])()
+    
+    def logout(self):
+        """Log the current user out"""
+        services.auth_service.logout()
     
     def view_available_courses(self):
         """View available courses for enrollment"""
-        self.ui.clear_screen()
-        self.ui.print_header("Available Courses")
+        self.ui.redraw("Available Courses")
         
         # Get current semester info
-        current_year = datetime.now().year
-        semester_choices = ["Spring", "Summer", "Fall"]
-        semester = self.ui.get_choice("Select Semester", semester_choices)
+        current_year = date.today().year
+        semester = self.ui.get_choice("Select Semester", _SEMESTERS)
         if not semester:
             return
         
         year = self.ui.get_input("Year", int) or current_year
         
-        user_info = auth_service.get_current_user_info()
-        student_id = user_info.get('student_id')
+        student_id = services.auth_service.student_id
         
-        sections = student_service.get_available_courses(student_id, semester, year)
+        sections = services.student_service.get_available_courses(student_id, semester, year)
         
         if not sections:
             self.ui.print_info("No available courses found")
             self.ui.wait_for_key()
             return
         
-        # Prepare table data
-        table_data = []
-        for section in sections:
-            table_data.append({
+        # Rows are built only as their page is displayed
+        table_data = (
+            {
                 'Section ID': section.section_id,
                 'Course ID': section.course_id,
                 'Course Name': section.course_name,
@@ -411,25 +596,25 @@ class StudentMenu:
                 'Location': section.location or 'TBA',
                 'Available': f"{section.available_spots}/{section.max_capacity}",
                 'Status': section.availability_status
-            })
+            }
+            for section in sections
+        )
         
-        self.ui.display_table(table_data, title="Available Courses")
+        self.ui.display_paged_table(table_data, title="Available Courses")
         self.ui.wait_for_key()
     
     def enroll_in_course(self):
         """Enroll in a course"""
-        self.ui.clear_screen()
-        self.ui.print_header("Course Enrollment")
+        self.ui.redraw("Course Enrollment")
         
         section_id = self.ui.get_input("Enter Section ID to enroll", int)
         if not section_id:
             return
         
-        user_info = auth_service.get_current_user_info()
-        student_id = user_info.get('student_id')
+        student_id = services.auth_service.student_id
         
         # Validate eligibility
-        eligible, warnings = student_service.validate_enrollment_eligibility(student_id, section_id)
+        eligible, warnings = services.student_service.validate_enrollment_eligibility(student_id, section_id)
         
         if not eligible:
             for warning in warnings:
@@ -445,7 +630,7 @@ class StudentMenu:
             return
         
         # Attempt enrollment
-        success, message = student_service.enroll_in_course(student_id, section_id)
+        success, message = services.student_service.enroll_in_course(student_id, section_id)
         
         if success:
             self.ui.print_success(message)
@@ -456,37 +641,25 @@ class StudentMenu:
     
     def view_schedule(self):
         """View current schedule"""
-        self.ui.clear_screen()
-        self.ui.print_header("My Schedule")
+        self.ui.redraw("My Schedule")
         
-        user_info = auth_service.get_current_user_info()
-        student_id = user_info.get('student_id')
+        student_id = services.auth_service.student_id
         
         # Get current semester
-        current_year = datetime.now().year
-        semester_choices = ["Current Semester", "All Semesters", "Specific Semester"]
-        choice = self.ui.get_choice("Select view", semester_choices)
+        current_year = date.today().year
+        choice = self.ui.get_choice("Select view", ("Current Semester", "All Semesters", "Specific Semester"))
         
         if choice == "Current Semester":
-            # Determine current semester
-            month = datetime.now().month
-            if 1 <= month <= 5:
-                semester = "Spring"
-            elif 6 <= month <= 8:
-                semester = "Summer"
-            else:
-                semester = "Fall"
-            
-            enrollments = student_service.get_student_schedule(student_id, semester, current_year)
+            semester, current_year = current_semester()
+            enrollments = services.student_service.get_student_schedule(student_id, semester, current_year)
         elif choice == "Specific Semester":
-            semester_choices = ["Spring", "Summer", "Fall"]
-            semester = self.ui.get_choice("Select Semester", semester_choices)
+            semester = self.ui.get_choice("Select Semester", _SEMESTERS)
             if not semester:
                 return
             year = self.ui.get_input("Year", int) or current_year
-            enrollments = student_service.get_student_schedule(student_id, semester, year)
+            enrollments = services.student_service.get_student_schedule(student_id, semester, year)
         else:
-            enrollments = student_service.get_student_schedule(student_id)
+            enrollments = services.student_service.get_student_schedule(student_id)
         
         if not enrollments:
             self.ui.print_info("No enrollments found")
@@ -494,9 +667,8 @@ class StudentMenu:
             return
         
         # Prepare table data
-        table_data = []
-        for enrollment in enrollments:
-            table_data.append({
+        table_data = (
+            {
                 'Course ID': enrollment.course_id,
                 'Course Name': enrollment.course_name,
                 'Credits': enrollment.credits,
@@ -504,33 +676,25 @@ class StudentMenu:
                 'Instructor': enrollment.instructor_name or 'TBA',
                 'Time': enrollment.time_slot or 'TBA',
                 'Location': enrollment.location or 'TBA',
-                'Status': enrollment.status,
+                'Status': enrollment.status.value,
                 'Grade': enrollment.final_grade if enrollment.final_grade else 'N/A'
-            })
+            }
+            for enrollment in enrollments
+        )
         
         self.ui.display_table(table_data, title="My Schedule")
         self.ui.wait_for_key()
     
     def drop_course(self):
         """Drop a course"""
-        self.ui.clear_screen()
-        self.ui.print_header("Drop Course")
+        self.ui.redraw("Drop Course")
         
-        user_info = auth_service.get_current_user_info()
-        student_id = user_info.get('student_id')
+        student_id = services.auth_service.student_id
         
         # Get current enrollments
-        current_year = datetime.now().year
-        month = datetime.now().month
-        if 1 <= month <= 5:
-            semester = "Spring"
-        elif 6 <= month <= 8:
-            semester = "Summer"
-        else:
-            semester = "Fall"
+        semester, current_year = current_semester()
         
-        enrollments = student_service.get_student_schedule(student_id, semester, current_year)
-        enrolled_courses = [e for e in enrollments if e.status == 'Enrolled']
+        enrolled_courses = services.student_service.get_current_enrollments(student_id, semester, current_year)
         
         if not enrolled_courses:
             self.ui.print_info("No enrolled courses to drop")
@@ -543,12 +707,12 @@ class StudentMenu:
             print(f"{i}. {enrollment.course_id} - {enrollment.course_name} (Section {enrollment.section_id})")
         
         try:
-            choice = int(input("\nSelect course to drop (number): ")) - 1
+            choice = int(read_line("\nSelect course to drop (number): ")) - 1
             if 0 <= choice < len(enrolled_courses):
                 selected_enrollment = enrolled_courses[choice]
                 
                 if self.ui.confirm_action(f"Are you sure you want to drop {selected_enrollment.course_name}?"):
-                    success, message = student_service.drop_course(student_id, selected_enrollment.section_id)
+                    success, message = services.student_service.drop_course(student_id, selected_enrollment.section_id)
                     
                     if success:
                         self.ui.print_success(message)
@@ -563,54 +727,42 @@ class StudentMenu:
     
     def view_transcript(self):
         """View complete transcript"""
-        self.ui.clear_screen()
-        self.ui.print_header("Academic Transcript")
+        self.ui.redraw("Academic Transcript")
         
-        user_info = auth_service.get_current_user_info()
-        student_id = user_info.get('student_id')
+        student_id = services.auth_service.student_id
         
-        enrollments, gpa_info = student_service.get_student_transcript(student_id)
+        enrollments, gpa_info = services.student_service.get_student_transcript(student_id)
         
         if not enrollments:
             self.ui.print_info("No academic records found")
             self.ui.wait_for_key()
             return
         
-        # Group by semester
-        semester_groups = {}
+        # Group by term, totalling graded credits and credit-weighted points in the same pass
+        semester_groups = defaultdict(list)
+        semester_totals = defaultdict(lambda: [0.0, 0.0])
         for enrollment in enrollments:
-            key = f"{enrollment.semester} {enrollment.year}"
-            if key not in semester_groups:
-                semester_groups[key] = []
+            key = (enrollment.year, enrollment.semester)
             semester_groups[key].append(enrollment)
-        
-        # Display by semester
-        for semester_key in sorted(semester_groups.keys()):
-            semester_enrollments = semester_groups[semester_key]
-            
-            print(f"\n{Fore.CYAN}{semester_key}")
-            print(f"{Fore.CYAN}{'-' * len(semester_key)}")
+            if enrollment.status is EnrollmentStatus.COMPLETED and enrollment.grade_points:
+                totals = semester_totals[key]
+                totals[0] += enrollment.credits
+                totals[1] += enrollment.grade_points * enrollment.credits
+        
+        # Display by term in chronological order
+        for (year, semester), semester_enrollments in sorted(
+                semester_groups.items(),
+                key=lambda item: (item[0][0], _SEMESTER_ORDER.get(item[0][1], len(_SEMESTER_ORDER)))):
+            table_data = (
+                (e.course_id, e.course_name, e.credits, e.final_grade or 'N/A',
+                 e.grade_points or 'N/A', e.status.value)
+                for e in semester_enrollments
+            )
             
-            table_data = []
-            semester_credits = 0
-            semester_points = 0
-            
-            for enrollment in semester_enrollments:
-                table_data.append({
-                    'Course ID': enrollment.course_id,
-                    'Course Name': enrollment.course_name,
-                    'Credits': enrollment.credits,
-                    'Grade': enrollment.final_grade if enrollment.final_grade else 'N/A',
-                    'Points': enrollment.grade_points if enrollment.grade_points else 'N/A',
-                    'Status': enrollment.status
-                })
-                
-                if enrollment.status == 'Completed' and enrollment.grade_points:
-                    semester_credits += enrollment.credits
-                    semester_points += enrollment.grade_points * enrollment.credits
-            
-            self.ui.display_table(table_data)
+            # The term label is the table title, written with the table in one call
+            self.ui.display_table(table_data, headers=_TRANSCRIPT_HEADERS, title=f"{semester} {year}")
             
+            semester_credits, semester_points = semester_totals.get((year, semester), (0, 0))
             if semester_credits > 0:
                 semester_gpa = semester_points / semester_credits
                 print(f"Semester Credits: {semester_credits:.1f}, Semester GPA: {semester_gpa:.2f}")
@@ -626,13 +778,11 @@ class StudentMenu:
     
     def view_gpa(self):
         """View GPA information"""
-        self.ui.clear_screen()
-        self.ui.print_header("GPA Information")
+        self.ui.redraw("GPA Information")
         
-        user_info = auth_service.get_current_user_info()
-        student_id = user_info.get('student_id')
+        student_id = services.auth_service.student_id
         
-        gpa_info = student_service.statistics_dao.get_student_gpa(student_id)
+        gpa_info = services.student_service.statistics_dao.get_student_gpa(student_id)
         
         if not gpa_info:
             self.ui.print_info("No GPA information available")
@@ -651,45 +801,40 @@ class StudentMenu:
 class InstructorMenu:
     """Instructor-specific menu"""
     
+    # Main options in display order, mapped to the method handling each
+    _DISPATCH = {
+        "View My Sections": "view_my_sections",
+        "View Section Roster": "view_section_roster",
+        "Update Student Grades": "update_grades",
+        "View Course Statistics": "view_course_statistics",
+        "Logout": "logout",
+    }
+    _CHOICES = tuple(_DISPATCH)
+    
     def __init__(self, ui: UIManager):
         self.ui = ui
     
     def show(self):
         """Show instructor menu"""
-        self.ui.clear_screen()
-        user_info = auth_service.get_current_user_info()
-        self.ui.print_header(f"Instructor Portal - {user_info.get('name', 'Instructor')}")
-        
-        choices = [
-            "View My Sections",
-            "View Section Roster",
-            "Update Student Grades",
-            "View Course Statistics",
-            "Logout"
-        ]
-        
-        choice = self.ui.get_choice("Please select an option:", choices, allow_cancel=False)
-        
-        if choice == "View My Sections":
-            self.view_my_sections()
-        elif choice == "View Section Roster":
-            self.view_section_roster()
-        elif choice == "Update Student Grades":
-            self.update_grades()
-        elif choice == "View Course Statistics":
-            self.view_course_statistics()
-        elif choice == "Logout":
-            auth_service.logout()
+        user_info = services.auth_service.get_current_user_info()
+        self.ui.redraw(f"Instructor Portal - {user_info.get('name', 'Instructor')}")
+        
+        choice = self.ui.get_choice("Please select an option:", self._CHOICES, allow_cancel=False)
+        
+        if choice:
+            getattr(self, self._DISPATCH[choice])()
+    
+    def logout(self):
+        """Log the current user out"""
+        services.auth_service.logout()
     
     def view_my_sections(self):
         """View instructor's sections"""
-        self.ui.clear_screen()
-        self.ui.print_header("My Sections")
+        self.ui.redraw("My Sections")
         
-        user_info = auth_service.get_current_user_info()
-        instructor_id = user_info.get('instructor_id')
+        instructor_id = services.auth_service.instructor_id
         
-        sections = instructor_service.get_instructor_sections(instructor_id)
+        sections = services.instructor_service.get_instructor_sections(instructor_id)
         
         if not sections:
             self.ui.print_info("No sections assigned")
@@ -702,61 +847,59 @@ class InstructorMenu:
     
     def view_section_roster(self):
         """View roster for a section"""
-        self.ui.clear_screen()
-        self.ui.print_header("Section Roster")
+        self.ui.redraw("Section Roster")
         
         section_id = self.ui.get_input("Enter Section ID", int)
         if not section_id:
             return
         
-        roster = instructor_service.get_section_roster(section_id)
+        roster = services.instructor_service.get_section_roster(section_id)
         
         if not roster:
             self.ui.print_info("No students enrolled in this section")
             self.ui.wait_for_key()
             return
         
-        # Prepare table data
-        table_data = []
-        for enrollment in roster:
-            table_data.append({
+        # Rows are built only as their page is displayed
+        table_data = (
+            {
                 'Student ID': enrollment.student_id,
                 'Student Name': enrollment.student_name,
-                'Status': enrollment.status,
+                'Status': enrollment.status.value,
                 'Final Grade': enrollment.final_grade if enrollment.final_grade else 'N/A',
                 'Grade Points': enrollment.grade_points if enrollment.grade_points else 'N/A',
-                'Enrollment Date': enrollment.enrollment_date.strftime("%Y-%m-%d") if enrollment.enrollment_date else 'N/A'
-            })
+                'Enrollment Date': enrollment.enrollment_date.date().isoformat() if enrollment.enrollment_date else 'N/A'
+            }
+            for enrollment in roster
+        )
         
-        self.ui.display_table(table_data, title=f"Section {section_id} Roster")
+        self.ui.display_paged_table(table_data, title=f"Section {section_id} Roster")
         self.ui.wait_for_key()
     
     def update_grades(self):
         """Update student grades"""
-        self.ui.clear_screen()
-        self.ui.print_header("Update Student Grades")
+        self.ui.redraw("Update Student Grades")
         
         section_id = self.ui.get_input("Enter Section ID", int)
         if not section_id:
             return
         
-        roster = instructor_service.get_section_roster(section_id)
+        enrolled_students = services.instructor_service.get_gradable_roster(section_id)
         
-        if not roster:
+        if not enrolled_students:
             self.ui.print_info("No students enrolled in this section")
             self.ui.wait_for_key()
             return
         
         # Show current roster
         print("\nCurrent Roster:")
-        enrolled_students = [e for e in roster if e.status in ['Enrolled', 'Completed']]
         
         for i, enrollment in enumerate(enrolled_students, 1):
             current_grade = enrollment.final_grade if enrollment.final_grade else 'N/A'
             print(f"{i}. {enrollment.student_name} ({enrollment.student_id}) - Current Grade: {current_grade}")
         
         try:
-            choice = int(input("\nSelect student to update grade (number): ")) - 1
+            choice = int(read_line("\nSelect student to update grade (number): ")) - 1
             if 0 <= choice < len(enrolled_students):
                 selected_enrollment = enrolled_students[choice]
                 
@@ -764,7 +907,7 @@ class InstructorMenu:
                 new_grade = self.ui.get_input("Enter final grade (0-100)", float)
                 
                 if new_grade is not None:
-                    success, message = instructor_service.update_student_grade(
+                    success, message = services.instructor_service.update_student_grade(
                         selected_enrollment.enrollment_id, new_grade
                     )
                     
@@ -781,20 +924,18 @@ class InstructorMenu:
     
     def view_course_statistics(self):
         """View course statistics"""
-        self.ui.clear_screen()
-        self.ui.print_header("Course Statistics")
+        self.ui.redraw("Course Statistics")
         
-        statistics = course_service.get_course_statistics()
+        statistics = services.course_service.get_course_statistics()
         
         if not statistics:
             self.ui.print_info("No statistics available")
             self.ui.wait_for_key()
             return
         
-        # Prepare table data
-        table_data = []
-        for stat in statistics:
-            table_data.append({
+        # Rows are built only as their page is displayed
+        table_data = (
+            {
                 'Course ID': stat.course_id,
                 'Course Name': stat.course_name,
                 'Credits': stat.credits,
@@ -804,278 +945,333 @@ class InstructorMenu:
                 'Completed': stat.completed_enrollments,
                 'Average Grade': stat.average_grade if stat.average_grade else 'N/A',
                 'Pass Rate': f"{stat.pass_rate:.1f}%" if stat.pass_rate else 'N/A'
-            })
+            }
+            for stat in statistics
+        )
         
-        self.ui.display_table(table_data, title="Course Statistics")
+        self.ui.display_paged_table(table_data, title="Course Statistics")
         self.ui.wait_for_key()
 
 class AdminMenu:
     """Administrator-specific menu"""
     
+    # Main options in display order, mapped to the method handling each
+    _DISPATCH = {
+        "Manage Departments": "manage_departments",
+        "Manage Courses": "manage_courses",
+        "Create Course Section": "create_section",
+        "View All Students": "view_all_students",
+        "View All Instructors": "view_all_instructors",
+        "System Statistics": "view_system_statistics",
+        "Logout": "logout",
+    }
+    _CHOICES = tuple(_DISPATCH)
+    
+    # Submenu options, mapped the same way; "Back" has no handler
+    _DEPARTMENT_ACTIONS = {
+        "View All Departments": "view_all_departments",
+        "Create New Department": "create_department",
+        "Back": None,
+    }
+    _DEPARTMENT_CHOICES = tuple(_DEPARTMENT_ACTIONS)
+    
+    _COURSE_ACTIONS = {
+        "View All Courses": "view_all_courses",
+        "Search Courses": "search_courses",
+        "Create New Course": "create_course",
+        "Back": None,
+    }
+    _COURSE_CHOICES = tuple(_COURSE_ACTIONS)
+    
     def __init__(self, ui: UIManager):
         self.ui = ui
+        # (expiry, instructors, "ID - Name" labels) for the section form and instructor list
+        self._instructor_cache = None
+    
+    def _department_names(self) -> Dict[str, str]:
+        """Map department IDs to names from the cached department list"""
+        departments, _ = self.ui.get_department_choices()
+        return {dept.dept_id: dept.dept_name for dept in departments}
+    
+    def _get_instructors_cached(self, ttl: float = 30) -> List[Instructor]:
+        """Get all instructors, reusing the last fetch for ttl seconds"""
+        return self._get_instructor_choices(ttl)[0]
+    
+    def _get_instructor_choices(self, ttl: float = 30) -> Tuple[List[Instructor], List[str]]:
+        """Get all instructors and their "ID - Name" menu labels, reused for ttl seconds"""
+        cache = self._instructor_cache
+        if cache is None or cache[0] < time.monotonic():
+            instructors = services.admin_service.get_all_instructors()
+            labels = [f"{i.instructor_id} - {i.name}" for i in instructors]
+            cache = (time.monotonic() + ttl, instructors, labels)
+            self._instructor_cache = cache
+        return cache[1], cache[2]
     
     def show(self):
         """Show admin menu"""
-        self.ui.clear_screen()
-        user_info = auth_service.get_current_user_info()
-        self.ui.print_header(f"Administrator Portal - {user_info.get('username', 'Admin')}")
-        
-        choices = [
-            "Manage Departments",
-            "Manage Courses",
-            "Create Course Section",
-            "View All Students",
-            "View All Instructors",
-            "System Statistics",
-            "Logout"
-        ]
-        
-        choice = self.ui.get_choice("Please select an option:", choices, allow_cancel=False)
-        
-        if choice == "Manage Departments":
-            self.manage_departments()
-        elif choice == "Manage Courses":
-            self.manage_courses()
-        elif choice == "Create Course Section":
-            self.create_section()
-        elif choice == "View All Students":
-            self.view_all_students()
-        elif choice == "View All Instructors":
-            self.view_all_instructors()
-        elif choice == "System Statistics":
-            self.view_system_statistics()
-        elif choice == "Logout":
-            auth_service.logout()
+        user_info = services.auth_service.get_current_user_info()
+        self.ui.redraw(f"Administrator Portal - {user_info.get('username', 'Admin')}")
+        
+        choice = self.ui.get_choice("Please select an option:", self._CHOICES, allow_cancel=False)
+        
+        if choice:
+            getattr(self, self._DISPATCH[choice])()
+    
+    def logout(self):
+        """Log the current user out"""
+        services.auth_service.logout()
     
     def manage_departments(self):
         """Manage departments"""
-        self.ui.clear_screen()
-        self.ui.print_header("Department Management")
+        self.ui.redraw("Department Management")
         
-        choices = ["View All Departments", "Create New Department", "Back"]
-        choice = self.ui.get_choice("Select action:", choices)
+        choice = self.ui.get_choice("Select action:", self._DEPARTMENT_CHOICES)
+        action = self._DEPARTMENT_ACTIONS.get(choice)
+        if action:
+            getattr(self, action)()
+    
+    def view_all_departments(self):
+        """List all departments"""
+        departments, _ = self.ui.get_department_choices()
         
-        if choice == "View All Departments":
-            departments = admin_service.get_all_departments()
+        if departments:
+            table_data = (
+                {
+                    'Department ID': dept.dept_id,
+                    'Department Name': dept.dept_name,
+                    'Department Head': dept.dept_head or 'N/A',
+                    'Created': dept.created_date.date().isoformat() if dept.created_date else 'N/A'
+                }
+                for dept in departments
+            )
             
-            if departments:
-                table_data = []
-                for dept in departments:
-                    table_data.append({
-                        'Department ID': dept.dept_id,
-                        'Department Name': dept.dept_name,
-                        'Department Head': dept.dept_head or 'N/A',
-                        'Created': dept.created_date.strftime("%Y-%m-%d") if dept.created_date else 'N/A'
-                    })
-                
-                self.ui.display_table(table_data, title="All Departments")
+            self.ui.display_table(table_data, title="All Departments")
+        else:
+            self.ui.print_info("No departments found")
+        
+        self.ui.wait_for_key()
+    
+    def create_department(self):
+        """Create a new department"""
+        dept_id = self.ui.get_input("Department ID")
+        dept_name = self.ui.get_input("Department Name")
+        dept_head = self.ui.get_input("Department Head", required=False)
+        
+        if dept_id and dept_name:
+            dept_data = {
+                'dept_id': dept_id,
+                'dept_name': dept_name,
+                'dept_head': dept_head
+            }
+            
+            success, message = services.admin_service.create_department(dept_data)
+            
+            if success:
+                self.ui.invalidate_departments()
+                self.ui.print_success(message)
             else:
-                self.ui.print_info("No departments found")
+                self.ui.print_error(message)
             
             self.ui.wait_for_key()
-        
-        elif choice == "Create New Department":
-            dept_id = self.ui.get_input("Department ID")
-            dept_name = self.ui.get_input("Department Name")
-            dept_head = self.ui.get_input("Department Head", required=False)
-            
-            if dept_id and dept_name:
-                dept_data = {
-                    'dept_id': dept_id,
-                    'dept_name': dept_name,
-                    'dept_head': dept_head
-                }
-                
-                success, message = admin_service.create_department(dept_data)
-                
-                if success:
-                    self.ui.print_success(message)
-                else:
-                    self.ui.print_error(message)
-                
-                self.ui.wait_for_key()
     
     def manage_courses(self):
         """Manage courses"""
-        self.ui.clear_screen()
-        self.ui.print_header("Course Management")
+        self.ui.redraw("Course Management")
         
-        choices = ["View All Courses", "Search Courses", "Create New Course", "Back"]
-        choice = self.ui.get_choice("Select action:", choices)
+        choice = self.ui.get_choice("Select action:", self._COURSE_CHOICES)
+        action = self._COURSE_ACTIONS.get(choice)
+        if action:
+            getattr(self, action)()
+    
+    def view_all_courses(self):
+        """List all courses"""
+        courses = services.course_service.search_courses()
+        
+        if courses:
+            # Department names resolved from one prefetched map, not per row
+            dept_names = self._department_names()
+            table_data = (
+                (course_id, name, credits, dept_names.get(dept, dept), course_type.value,
+                 _truncate(description))
+                for course_id, name, credits, dept, course_type, description in map(_course_fields, courses)
+            )
+            
+            self.ui.display_table(table_data, headers=_COURSE_HEADERS, title="All Courses")
+        else:
+            self.ui.print_info("No courses found")
         
-        if choice == "View All Courses":
-            courses = course_service.search_courses()
+        self.ui.wait_for_key()
+    
+    def search_courses(self):
+        """Search courses by keyword"""
+        search_term = self.ui.get_input("Enter search term")
+        if search_term:
+            courses = services.course_service.search_courses(search_term)
             
             if courses:
-                table_data = []
-                for course in courses:
-                    table_data.append({
-                        'Course ID': course.course_id,
-                        'Course Name': course.course_name,
-                        'Credits': course.credits,
-                        'Department': course.department,
-                        'Type': course.course_type.value,
-                        'Description': course.description[:50] + '...' if course.description and len(course.description) > 50 else course.description or ''
-                    })
+                dept_names = self._department_names()
+                table_data = (
+                    (course_id, name, credits, dept_names.get(dept, dept), course_type.value)
+                    for course_id, name, credits, dept, course_type, _ in map(_course_fields, courses)
+                )
                 
-                self.ui.display_table(table_data, title="All Courses")
+                self.ui.display_table(table_data, headers=_COURSE_HEADERS[:-1],
+                                      title=f"Search Results for '{search_term}'")
             else:
-                self.ui.print_info("No courses found")
+                self.ui.print_info("No courses found matching the search term")
             
             self.ui.wait_for_key()
+    
+    def create_course(self):
+        """Create a new course"""
+        course_id = self.ui.get_input("Course ID")
+        course_name = self.ui.get_input("Course Name")
+        credits = self.ui.get_input("Credits", float)
+        # A cancelled required field ends the form before the department list is fetched
+        if not (course_id and course_name and credits):
+            return
         
-        elif choice == "Search Courses":
-            search_term = self.ui.get_input("Enter search term")
-            if search_term:
-                courses = course_service.search_courses(search_term)
-                
-                if courses:
-                    table_data = []
-                    for course in courses:
-                        table_data.append({
-                            'Course ID': course.course_id,
-                            'Course Name': course.course_name,
-                            'Credits': course.credits,
-                            'Department': course.department,
-                            'Type': course.course_type.value
-                        })
-                    
-                    self.ui.display_table(table_data, title=f"Search Results for '{search_term}'")
-                else:
-                    self.ui.print_info("No courses found matching the search term")
-                
-                self.ui.wait_for_key()
+        # Get departments
+        departments, dept_choices = self.ui.get_department_choices()
+        if departments:
+            dept_choice = self.ui.get_choice("Department", dept_choices)
+            department = dept_choice.split(" - ")[0] if dept_choice else None
+        else:
+            department = self.ui.get_input("Department Code", required=False)
         
-        elif choice == "Create New Course":
-            course_id = self.ui.get_input("Course ID")
-            course_name = self.ui.get_input("Course Name")
-            credits = self.ui.get_input("Credits", float)
-            
-            # Get departments
-            departments = admin_service.get_all_departments()
-            if departments:
-                dept_choices = [f"{d.dept_id} - {d.dept_name}" for d in departments]
-                dept_choice = self.ui.get_choice("Department", dept_choices)
-                department = dept_choice.split(" - ")[0] if dept_choice else None
-            else:
-                department = self.ui.get_input("Department Code", required=False)
+        # Course type
+        course_type_str = self.ui.get_choice("Course Type", _COURSE_TYPES)
+        
+        description = self.ui.get_input("Description", required=False)
+        
+        if course_type_str:
+            course_data = {
+                'course_id': course_id,
+                'course_name': course_name,
+                'credits': credits,
+                'department': department,
+                'course_type': course_type_str,
+                'description': description
+            }
             
-            # Course type
-            type_choices = [ct.value for ct in CourseType]
-            course_type_str = self.ui.get_choice("Course Type", type_choices)
+            success, message = services.course_service.create_course(course_data)
             
-            description = self.ui.get_input("Description", required=False)
+            if success:
+                self.ui.print_success(message)
+            else:
+                self.ui.print_error(message)
             
-            if course_id and course_name and credits and course_type_str:
-                course_data = {
-                    'course_id': course_id,
-                    'course_name': course_name,
-                    'credits': credits,
-                    'department': department,
-                    'course_type': course_type_str,
-                    'description': description
-                }
-                
-                success, message = course_service.create_course(course_data)
-                
-                if success:
-                    self.ui.print_success(message)
-                else:
-                    self.ui.print_error(message)
-                
-                self.ui.wait_for_key()
+            self.ui.wait_for_key()
     
     def create_section(self):
         """Create a new course section"""
-        self.ui.clear_screen()
-        self.ui.print_header("Create Course Section")
+        self.ui.redraw("Create Course Section")
         
-        course_id = self.ui.get_input("Course ID")
+        # Pick the course from the catalog so a mistyped ID cannot reach the INSERT
+        courses = services.course_service.list_course_ids_and_names()
+        if courses:
+            course_choice = self.ui.get_choice("Course", (f"{cid} - {name}" for cid, name in courses))
+            course_id = course_choice.split(" - ")[0] if course_choice else None
+        else:
+            course_id = self.ui.get_input("Course ID")
+        if not course_id:
+            return
+        
+        semester = self.ui.get_choice("Semester", _SEMESTERS)
+        
+        year = self.ui.get_input("Year", int)
+        max_capacity = self.ui.get_input("Maximum Capacity", int)
+        # Required fields come first so a cancelled form never fetches the instructor list
+        if not (semester and year and max_capacity):
+            return
         
         # Get instructors
-        instructors = admin_service.get_all_instructors()
+        instructors, instructor_choices = self._get_instructor_choices()
         if instructors:
-            instructor_choices = [f"{i.instructor_id} - {i.name}" for i in instructors]
             instructor_choice = self.ui.get_choice("Instructor", instructor_choices)
             instructor_id = instructor_choice.split(" - ")[0] if instructor_choice else None
         else:
             instructor_id = self.ui.get_input("Instructor ID", required=False)
         
-        semester_choices = ["Spring", "Summer", "Fall"]
-        semester = self.ui.get_choice("Semester", semester_choices)
-        
-        year = self.ui.get_input("Year", int)
-        max_capacity = self.ui.get_input("Maximum Capacity", int)
         time_slot = self.ui.get_input("Time Slot (e.g., MWF 09:00-09:50)", required=False)
         location = self.ui.get_input("Location", required=False)
         
-        if course_id and semester and year and max_capacity:
-            section_data = {
-                'course_id': course_id,
-                'instructor_id': instructor_id,
-                'semester': semester,
-                'year': year,
-                'max_capacity': max_capacity,
-                'time_slot': time_slot,
-                'location': location
-            }
-            
-            success, message = course_service.create_section(section_data)
-            
-            if success:
-                self.ui.print_success(message)
-            else:
-                self.ui.print_error(message)
-            
-            self.ui.wait_for_key()
+        section_data = {
+            'course_id': course_id,
+            'instructor_id': instructor_id,
+            'semester': semester,
+            'year': year,
+            'max_capacity': max_capacity,
+            'time_slot': time_slot,
+            'location': location
+        }
+        
+        success, message = services.course_service.create_section(section_data)
+        
+        if success:
+            self.ui.print_success(message)
+        else:
+            self.ui.print_error(message)
+        
+        self.ui.wait_for_key()
     
     def view_all_students(self):
         """View all students"""
-        self.ui.clear_screen()
-        self.ui.print_header("All Students")
-        
-        students = admin_service.get_all_students(limit=50)  # Limit for display
-        
-        if students:
-            table_data = []
-            for student in students:
-                table_data.append({
-                    'Student ID': student.student_id,
-                    'Name': student.name,
-                    'Gender': student.gender.value if student.gender else 'N/A',
-                    'Email': student.email or 'N/A',
-                    'College': student.college or 'N/A',
-                    'Major': student.major or 'N/A',
-                    'Enrollment Year': student.enrollment_year or 'N/A'
-                })
+        self.ui.redraw("All Students")
+        
+        page_size = 50
+        # Keyset cursor (last StudentID of the previous page) for each page visited so far
+        page_starts = [None]
+        dept_names = None
+        
+        while True:
+            # One row past the page tells whether a next page exists
+            students = services.admin_service.get_all_students(limit=page_size + 1,
+                                                               after_id=page_starts[-1])
+            has_next = len(students) > page_size
+            students = students[:page_size]
             
-            self.ui.display_table(table_data, title="All Students (First 50)")
-        else:
-            self.ui.print_info("No students found")
+            if not students:
+                self.ui.print_info("No students found")
+                break
+            
+            if dept_names is None:
+                dept_names = self._department_names()
+            table_data = (
+                (student_id, name, gender.value if gender else 'N/A', email or 'N/A',
+                 dept_names.get(college, college) or 'N/A', major or 'N/A', year or 'N/A')
+                for student_id, name, gender, email, college, major, year in map(_student_fields, students)
+            )
+            
+            self.ui.display_table(table_data, headers=_STUDENT_HEADERS,
+                                  title=f"All Students (page {len(page_starts)})")
+            
+            options = (("Next Page",) if has_next else ()) + (("Previous Page",) if len(page_starts) > 1 else ())
+            action = self.ui.get_choice("Navigate", options) if options else None
+            if action == "Next Page":
+                page_starts.append(students[-1].student_id)
+            elif action == "Previous Page":
+                page_starts.pop()
+            else:
+                break
         
         self.ui.wait_for_key()
     
     def view_all_instructors(self):
         """View all instructors"""
-        self.ui.clear_screen()
-        self.ui.print_header("All Instructors")
+        self.ui.redraw("All Instructors")
         
-        instructors = admin_service.get_all_instructors()
+        instructors = self._get_instructors_cached()
         
         if instructors:
-            table_data = []
-            for instructor in instructors:
-                table_data.append({
-                    'Instructor ID': instructor.instructor_id,
-                    'Name': instructor.name,
-                    'Department': instructor.department or 'N/A',
-                    'Title': instructor.title or 'N/A',
-                    'Email': instructor.email or 'N/A',
-                    'Phone': instructor.phone or 'N/A'
-                })
+            dept_names = self._department_names()
+            table_data = (
+                (instructor_id, name, dept_names.get(dept, dept) or 'N/A', title or 'N/A',
+                 email or 'N/A', phone or 'N/A')
+                for instructor_id, name, dept, title, email, phone in map(_instructor_fields, instructors)
+            )
             
-            self.ui.display_table(table_data, title="All Instructors")
+            self.ui.display_table(table_data, headers=_INSTRUCTOR_HEADERS, title="All Instructors")
         else:
             self.ui.print_info("No instructors found")
         
@@ -1083,17 +1279,20 @@ class AdminMenu:
     
     def view_system_statistics(self):
         """View system statistics"""
-        self.ui.clear_screen()
-        self.ui.print_header("System Statistics")
+        self.ui.redraw("System Statistics")
         
-        stats = admin_service.get_system_statistics()
+        stats = services.admin_service.get_system_statistics()
         
         if stats:
-            print(f"Total Students: {stats.get('total_students', 0)}")
-            print(f"Total Instructors: {stats.get('total_instructors', 0)}")
-            print(f"Total Departments: {stats.get('total_departments', 0)}")
-            print(f"Total Courses: {stats.get('total_courses', 0)}")
-            print(f"Total Enrollments: {stats.get('total_enrollments', 0)}")
+            # All counts go out in a single write
+            sys.stdout.write(
+                f"Total Students: {stats.get('total_students', 0)}\n"
+                f"Total Instructors: {stats.get('total_instructors', 0)}\n"
+                f"Total Departments: {stats.get('total_departments', 0)}\n"
+                f"Total Courses: {stats.get('total_courses', 0)}\n"
+                f"Total Enrollments: {stats.get('total_enrollments', 0)}\n"
+            )
+            sys.stdout.flush()
         else:
             self.ui.print_info("No statistics available")
         
@@ -1109,22 +1308,33 @@ class CourseRegistrationUI:
         self.student_menu = StudentMenu(self.ui)
         self.instructor_menu = InstructorMenu(self.ui)
         self.admin_menu = AdminMenu(self.ui)
+        # Main menu for each role, bound once per login by bind_menu_for_role
+        self._menus_by_role = {
+            UserType.STUDENT: self.student_menu,
+            UserType.INSTRUCTOR: self.instructor_menu,
+            UserType.ADMIN: self.admin_menu,
+        }
     
     def show_login_menu(self):
         """Show login menu"""
         self.login_menu.show()
+        if services.auth_service.is_authenticated():
+            # The role is fixed for the session, so its menu is resolved once here
+            self.bind_menu_for_role(services.auth_service.current_role())
+    
+    def bind_menu_for_role(self, role: Optional[UserType]):
+        """Point the UI's main menu straight at the menu for role, or back at the resolving one"""
+        menu = self._menus_by_role.get(role)
+        self.ui.show_main_menu = menu.show if menu else self.show_main_menu
     
     def show_main_menu(self):
         """Show appropriate main menu based on user role"""
-        if auth_service.has_role(UserType.STUDENT):
-            self.student_menu.show()
-        elif auth_service.has_role(UserType.INSTRUCTOR):
-            self.instructor_menu.show()
-        elif auth_service.has_role(UserType.ADMIN):
-            self.admin_menu.show()
+        menu = self._menus_by_role.get(services.auth_service.current_role())
+        if menu:
+            menu.show()
         else:
             self.ui.print_error("Unknown user role")
-            auth_service.logout()
+            services.auth_service.logout()
     
     def run(self):
         """Run the application"""